@@ -11,12 +11,42 @@ Options can be passed via environment variables:
     GLINER_PROFILE (default: 'default')
     GLINER_THRESHOLD (default: 0.3)
     GLINER_LABELS (comma-separated, default: use profile defaults)
+    GLINER_BATCH (lines per batched GLiNER call, default: 32)
+
+Repeated lines (headers, boilerplate) are anonymized only once.
 """
 
-from text_anonymizer import TextAnonymizer
+from text_anonymizer import get_anonymizer
 import sys
 import os
 
+DEFAULT_BATCH_SIZE = 32
+CACHE_SIZE = 100_000
+
+
+def read_batches(stream, batch_size):
+    """Yield lists of up to batch_size lines; empty lines are kept as None."""
+    batch = []
+    for line in stream:
+        text = line.rstrip('\n\r')  # Remove newline but preserve content
+        batch.append(text if text else None)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def anonymize_lines(text_anonymizer, batch, cache, **kwargs):
+    """Anonymize a batch of lines, sending only lines not already in cache to the model."""
+    if len(cache) + len(batch) > CACHE_SIZE:
+        cache.clear()
+    pending = [text for text in dict.fromkeys(batch) if text and text not in cache]
+    if pending:
+        cache.update(zip(pending, text_anonymizer.anonymize_text_batch(pending, **kwargs)))
+    return [cache[text] if text else text for text in batch]
+
+
 def main():
     # Get configuration from environment variables
     profile = os.getenv('GLINER_PROFILE', 'default')
@@ -28,23 +58,30 @@ def main():
     labels_str = os.getenv('GLINER_LABELS')
     labels = labels_str.split(',') if labels_str else None
 
+    try:
+        batch_size = max(1, int(os.getenv('GLINER_BATCH', str(DEFAULT_BATCH_SIZE))))
+    except ValueError:
+        batch_size = DEFAULT_BATCH_SIZE
+
     # Initialize anonymizer
-    text_anonymizer = TextAnonymizer()
+    text_anonymizer = get_anonymizer()
+    labels = text_anonymizer.prepare_labels(labels)
 
-    # Process each line from stdin
+    # Process stdin in batches of lines
+    cache = {}
     try:
-        for line in sys.stdin:
-            text = line.rstrip('\n\r')  # Remove newline but preserve content
-            if text:
-                anonymized = text_anonymizer.anonymize_text(
-                    text,
-                    profile=profile,
-                    labels=labels,
-                    gliner_threshold=threshold
-                )
-                print(anonymized)
-            else:
-                print()  # Preserve empty lines
+        for batch in read_batches(sys.stdin, batch_size):
+            anonymized_lines = anonymize_lines(
+                text_anonymizer,
+                batch,
+                cache,
+                profile=profile,
+                labels=labels,
+                gliner_threshold=threshold
+            )
+            for anonymized in anonymized_lines:
+                print(anonymized if anonymized is not None else '')  # Preserve empty lines
+            sys.stdout.flush()
     except KeyboardInterrupt:
         sys.exit(0)
     except Exception as e:
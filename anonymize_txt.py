@@ -13,11 +13,105 @@ Options:
     --separator: String separator for document boundaries (default: none)
     --profile: Profile name for configuration (default: default)
     --threshold: GLiNER confidence threshold 0.0-1.0 (default: 0.6)
+    --batch_size: Documents per batched anonymizer call (default: 16)
 """
 
 import argparse
+import queue
+import threading
+
+from text_anonymizer import get_anonymizer
+
+# Documents per batched anonymizer call and batches prepared ahead of the model
+DEFAULT_BATCH_SIZE = 16
+PREFETCH_BATCHES = 4
+# Buffer size for source and target files
+IO_BUFFER_SIZE = 1024 * 1024
+# Output pieces collected before writing them to the target file
+WRITE_CHUNK = 64
+
+
+def prepare_raw_text(line):
+    """Remove excessive whitespace from text line."""
+    return ' '.join(line.split())
+
+
+def iter_documents(in_file):
+    """
+    Read file line by line and yield documents (lists of prepared lines).
+
+    A document ends after two blank lines or at the end of the file.
+    """
+    doc = []
+    newline_counter = 0
+    for line in in_file:
+        if line != '\n':
+            # remove double spaces etc
+            prepared = prepare_raw_text(line)
+            if prepared:
+                doc.append(prepared)
+        else:
+            newline_counter += 1
+
+        if newline_counter >= 2:
+            newline_counter = 0
+            yield doc
+            doc = []
+    yield doc
+
+
+def prefetch(iterable, maxsize):
+    """
+    Iterate over iterable in a background thread, keeping up to maxsize items ready.
+
+    Lets file reading overlap with model inference. Exceptions raised while
+    reading are re-raised in the consuming thread.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    done = object()
+    errors = []
+
+    def reader():
+        try:
+            for item in iterable:
+                items.put(item)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            items.put(done)
+
+    threading.Thread(target=reader, daemon=True).start()
+    while True:
+        item = items.get()
+        if item is done:
+            break
+        yield item
+    if errors:
+        raise errors[0]
+
+
+def iter_batches(iterable, batch_size):
+    """Yield lists of up to batch_size items."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_document_batches(in_file, batch_size):
+    """Yield (documents, texts) batches where texts are the documents joined for the anonymizer."""
+    for batch in iter_batches(iter_documents(in_file), batch_size):
+        yield batch, [' '.join(doc) for doc in batch]
+
+
+def parse_bool(value):
+    """Parse true/false command line value."""
+    return value.lower() == 'true'
 
-from text_anonymizer import TextAnonymizer
 
 def main():
 
@@ -27,40 +121,24 @@ def main():
     )
     parser.add_argument('source_file', type=str, help='Text file to be anonymized')
     parser.add_argument('target_file', type=str, help='Name or path of (anonymized) destination file.')
-    parser.add_argument('--debug', type=str, help='Toggle debug logging. Shows scores within labels. (true/false, default: false)')
-    parser.add_argument('--encoding', type=str, help='Source encoding. Default: UTF-8')
-    parser.add_argument('--separator', type=str, help='String separator for newlines. Default: None')
-    parser.add_argument('--profile', type=str, help='Profile name for configuration. Default: default')
-    parser.add_argument('--threshold', type=float, help='GLiNER confidence threshold (0.0-1.0). Default: 0.6')
-    parser.add_argument('--labels', type=str, help='Entity labels to detect (comma-separated). Default: use profile defaults')
-
-    debug = False
+    parser.add_argument('--debug', type=parse_bool, default=False, help='Toggle debug logging. Shows scores within labels. (true/false, default: false)')
+    parser.add_argument('--encoding', type=str, default='UTF-8', help='Source encoding. Default: UTF-8')
+    parser.add_argument('--separator', type=str, default=None, help='String separator for newlines. Default: None')
+    parser.add_argument('--profile', type=str, default='default', help='Profile name for configuration. Default: default')
+    parser.add_argument('--threshold', type=float, default=0.6, help='GLiNER confidence threshold (0.0-1.0). Default: 0.6')
+    parser.add_argument('--labels', type=str, default=None, help='Entity labels to detect (comma-separated). Default: use profile defaults')
+    parser.add_argument('--batch_size', type=int, default=DEFAULT_BATCH_SIZE, help='Documents per batched anonymizer call. Default: 16')
 
     args = parser.parse_args()
-    source_encoding = 'UTF-8'
-    source_file = None
-    target_file = None
-    separator = None
-    profile = 'default'
-    threshold = 0.6
-    labels = None
-
-    if args.source_file:
-        source_file = args.source_file
-    if args.target_file:
-        target_file = args.target_file
-    if args.debug and "true" == args.debug.lower():
-        debug = True
-    if args.encoding:
-        source_encoding = args.encoding
-    if args.separator:
-        separator = args.separator
-    if args.profile:
-        profile = args.profile
-    if args.threshold:
-        threshold = args.threshold
-    if args.labels:
-        labels = args.labels.split(',') if args.labels else None
+    source_file = args.source_file
+    target_file = args.target_file
+    debug = args.debug
+    source_encoding = args.encoding
+    separator = args.separator
+    profile = args.profile
+    threshold = args.threshold
+    labels = args.labels.split(',') if args.labels else None
+    batch_size = args.batch_size
 
     print("Anonymizing file: {i}. ".format(i=source_file))
 
@@ -75,77 +153,50 @@ def main():
         print("- Labels: {s}".format(s=labels))
     print("")
 
-    text_anonymizer = TextAnonymizer(debug_mode=debug)
+    text_anonymizer = get_anonymizer(debug_mode=debug)
+    labels = text_anonymizer.prepare_labels(labels)
     statistics = []
     details = []
 
-    def anonymize(doc: [str]) -> (str, object, object):
-        """
-        Anonymize a document (list of lines) and return results.
-
-        Args:
-            doc: List of text lines
-
-        Returns:
-            Tuple of (anonymized_text, summary_stats, entity_details)
-        """
-        a = ' '.join(doc)
-        if a:
-            result = text_anonymizer.anonymize(
-                a,
-                labels=labels,
-                profile=profile,
-                gliner_threshold=threshold
-            )
-            return result.anonymized_text, result.summary, result.details
-        return None, None, None
-
-    def prepare_raw_text(line):
-        """Remove excessive whitespace from text line."""
-        import re
-        line = re.sub(r'\s+', ' ', line)
-        return line
-
     if source_file:
         try:
             # use same encoding for source and target file
-            with open(target_file, mode='w+', newline='', encoding=source_encoding) as outfile:
-                with open(source_file, mode='r', newline='', encoding=source_encoding) as in_file:
-                    lines = in_file.readlines()
-                    doc = []
-                    newline_counter = 0
-                    line_counter = 0
-
-                    for line in lines:
-                        line_counter += 1
-                        if line != '\n':
-                            # remove double spaces etc
-                            prepared = prepare_raw_text(line)
-                            doc.append(prepared)
-                        else:
-                            newline_counter += 1
-
-                        if newline_counter >= 2 or line_counter >= len(lines):
-                            newline_counter = 0
-                            anonymized, stats, detail = anonymize(doc)
+            with open(target_file, mode='w+', newline='', encoding=source_encoding,
+                      buffering=IO_BUFFER_SIZE) as outfile:
+                with open(source_file, mode='r', newline='', encoding=source_encoding,
+                          buffering=IO_BUFFER_SIZE) as in_file:
+                    # Reading, normalizing and batching run in the prefetch thread,
+                    # the main thread only runs the model on ready batches
+                    batches = prefetch(iter_document_batches(in_file, batch_size), PREFETCH_BATCHES)
+                    output = []
+                    for batch, texts in batches:
+                        results = text_anonymizer.anonymize_batch(
+                            texts,
+                            labels=labels,
+                            profile=profile,
+                            gliner_threshold=threshold
+                        )
+                        for doc, result in zip(batch, results):
+                            anonymized = result.anonymized_text
                             if anonymized:
-                                anonymized = ' '.join(anonymized.split())
-                                if stats:
-                                    statistics.append(stats)
-                                if detail:
-                                    details.append(detail)
+                                if result.summary:
+                                    statistics.append(result.summary)
+                                if result.details:
+                                    details.append(result.details)
                                 if debug:
                                     if doc:
                                         print('>>> Original: ')
-                                        print(''.join(doc))
+                                        print(' '.join(doc))
                                         print('>>> Anonymized: ')
                                         print(anonymized)
                                         print('---')
-                            doc = []
-                            if anonymized:
-                                outfile.write(anonymized)
+                                output.append(anonymized)
                                 if separator:
-                                    outfile.write("\n{separator}\n")
+                                    output.append(f"\n{separator}\n")
+                        if len(output) >= WRITE_CHUNK:
+                            outfile.write(''.join(output))
+                            output.clear()
+                    outfile.write(''.join(output))
         except Exception as e:
             print("Error: ", e)
             if 'codec' in str(e):
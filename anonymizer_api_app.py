@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 import os
 import logging
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Header
+from fastapi.responses import StreamingResponse
 
 from text_anonymizer import TextAnonymizer
 from text_anonymizer.api_models import AnonymizerApiRequest, AnonymizerApiResponse
@@ -23,6 +24,10 @@ TWO_PASS_DETECTION = os.getenv("TWO_PASS_DETECTION", "true").lower() == "true"
 text_anonymizer = TextAnonymizer(debug_mode=debug, two_pass_detection=TWO_PASS_DETECTION)
 logger.info(f"TextAnonymizer initialized (two_pass_detection={TWO_PASS_DETECTION})")
 
+# Items per anonymizer call when /anonymize_batch streams ndjson
+STREAM_CHUNK_SIZE = 32
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 # Enable/disable watcher via env var CONFIG_WATCHER_ENABLED (default: true)
 WATCHER_ENABLED = os.getenv("CONFIG_WATCHER_ENABLED", "true").lower() == "true"
 CONFIG_DIR = ConfigCache.instance().config_dir
@@ -32,6 +37,8 @@ def on_config_change():
     """Callback triggered when config files change."""
     global text_anonymizer
     logger.info("Config change detected, recreating anonymizer")
+    # Drop the shared config so the new anonymizer reads the changed files
+    ConfigCache.reset_instance()
     text_anonymizer = TextAnonymizer(debug_mode=debug, two_pass_detection=TWO_PASS_DETECTION)
 
 
@@ -55,24 +62,49 @@ def anonymize(request_data: AnonymizerApiRequest) -> AnonymizerApiResponse:
     return response
 
 
-@anonymizer_api.post("/anonymize_batch")
-def anonymize_batch(request_data: List[AnonymizerApiRequest]) -> List[AnonymizerApiResponse]:
-    responses = []
-    for request in request_data:
-        anonymizer_result = text_anonymizer.anonymize(
-            request.text,
-            labels=request.labels,
-            profile=request.profile or 'default',
-            gliner_threshold=request.gliner_threshold,
+def anonymize_requests(request_data: List[AnonymizerApiRequest]) -> List[AnonymizerApiResponse]:
+    """Anonymize requests in input order, one batched call per group of identical settings."""
+    groups = {}
+    for index, request in enumerate(request_data):
+        key = (
+            tuple(request.labels) if request.labels is not None else None,
+            request.profile or 'default',
+            request.gliner_threshold,
         )
-
-        response: AnonymizerApiResponse = AnonymizerApiResponse()
-        response.anonymized_txt = anonymizer_result.anonymized_text
-        response.summary = anonymizer_result.summary
-        responses.append(response)
+        groups.setdefault(key, []).append(index)
+
+    responses = [None] * len(request_data)
+    for (labels, profile, gliner_threshold), indices in groups.items():
+        anonymizer_results = text_anonymizer.anonymize_batch(
+            [request_data[index].text for index in indices],
+            labels=list(labels) if labels is not None else None,
+            profile=profile,
+            gliner_threshold=gliner_threshold,
+        )
+        for index, anonymizer_result in zip(indices, anonymizer_results):
+            response: AnonymizerApiResponse = AnonymizerApiResponse()
+            response.anonymized_txt = anonymizer_result.anonymized_text
+            response.summary = anonymizer_result.summary
+            responses[index] = response
 
     return responses
 
 
+def iter_ndjson(request_data: List[AnonymizerApiRequest]):
+    """Yield responses as newline-delimited JSON, anonymizing STREAM_CHUNK_SIZE items at a time."""
+    for start in range(0, len(request_data), STREAM_CHUNK_SIZE):
+        for response in anonymize_requests(request_data[start:start + STREAM_CHUNK_SIZE]):
+            yield response.model_dump_json() + "\n"
+
+
+@anonymizer_api.post("/anonymize_batch")
+def anonymize_batch(request_data: List[AnonymizerApiRequest],
+                    accept: Optional[str] = Header(default=None)) -> List[AnonymizerApiResponse]:
+    # Clients asking for ndjson get results streamed in input order as they are ready
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(iter_ndjson(request_data), media_type=NDJSON_MEDIA_TYPE)
+    return anonymize_requests(request_data)
+
+
 if __name__ == "__main__":
     uvicorn.run(anonymizer_api, host="0.0.0.0", port=8000)
\ No newline at end of file
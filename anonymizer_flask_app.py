@@ -1,13 +1,17 @@
-from flask import Flask, render_template, request, session, send_file
+from flask import Flask, Response, render_template, request, session, send_file
 from flask_session import Session
 import pandas as pd
-from text_anonymizer import TextAnonymizer
+from text_anonymizer import get_anonymizer
 from text_anonymizer.config_cache import ConfigCache
 from werkzeug.utils import secure_filename
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import io
+import itertools
 import os
 import logging
 import secrets
+import time
 
 logging.getLogger().setLevel(logging.WARN)
 
@@ -32,14 +36,18 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # Max upload size, here set
 # Ensure the upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
-# Init anonymizer as singleton
-text_anonymizer = TextAnonymizer(debug_mode=False)
+# Anonymizer is created lazily via get_anonymizer() on first request.
+# With GLINER_PRELOAD=true (set by entrypoint.sh for gunicorn --preload) the model
+# is loaded once in the master process and shared copy-on-write by forked workers.
+if os.getenv('GLINER_PRELOAD', 'false').lower() == 'true':
+    get_anonymizer(debug_mode=False)
 
-# Load label mappings from config first
+# Load label mappings from config first (read once per process via the shared ConfigCache)
 config_cache = ConfigCache.instance()
 label_mappings = config_cache.get_label_mappings()
 
 
+@functools.lru_cache(maxsize=None)
 def get_label_display_name(label: str) -> str:
     """
     Get display name for a label using label_mappings.
@@ -63,27 +71,82 @@ def get_label_display_name(label: str) -> str:
 
 
 # Available labels for the UI (grouped by type) - now with display names
-NER_LABELS = [
-    ('person_ner', get_label_display_name('person_ner')),
-    ('email_ner', get_label_display_name('email_ner')),
-    ('phone_number_ner', get_label_display_name('phone_number_ner')),
-    ('address_ner', get_label_display_name('address_ner')),
-    ('organization_ner', get_label_display_name('organization_ner')),
-    ('location_ner', get_label_display_name('location_ner')),
-]
-
-REGEX_LABELS = [
-    ('fi_hetu_regex', get_label_display_name('fi_hetu_regex')),
-    ('fi_puhelin_regex', get_label_display_name('fi_puhelin_regex')),
-    ('fi_rekisteri_regex', get_label_display_name('fi_rekisteri_regex')),
-    ('fi_iban_regex', get_label_display_name('fi_iban_regex')),
-]
+_RAW_NER_LABELS = ('person_ner', 'email_ner', 'phone_number_ner', 'address_ner',
+                   'organization_ner', 'location_ner')
+_RAW_REGEX_LABELS = ('fi_hetu_regex', 'fi_puhelin_regex', 'fi_rekisteri_regex', 'fi_iban_regex')
+
+NER_LABELS = [(label, get_label_display_name(label)) for label in _RAW_NER_LABELS]
+REGEX_LABELS = [(label, get_label_display_name(label)) for label in _RAW_REGEX_LABELS]
 
 ALL_LABELS = NER_LABELS + REGEX_LABELS
 
 # Default threshold
 DEFAULT_THRESHOLD = 0.6
 
+# Rows per chunk when streaming anonymized CSV to the client
+CSV_STREAM_ROWS = 10_000
+
+CELL_CACHE_SIZE = 100_000
+BATCH_SIZE = 32
+# Threads anonymizing slices of CSV values concurrently, opt-in. Each forward
+# pass already uses all torch CPU threads, so more workers oversubscribe the
+# cores; on CUDA a single worker is always used.
+CSV_WORKERS = max(1, int(os.getenv('CSV_WORKERS', '1')))
+
+# Anonymized CSV cells keyed on (text, labels, threshold); repeated cells skip the model
+cell_cache = {}
+
+
+def anonymize_cells(texts, labels, gliner_threshold):
+    """
+    Anonymize CSV cell values with batched GLiNER calls.
+
+    Returns dict mapping each given text to its anonymized version. Only values
+    not found in cell_cache are sent to the model. With CSV_WORKERS > 1 and the
+    model on CPU, pending values are split into slices that are anonymized
+    concurrently with the shared anonymizer.
+    """
+    if len(cell_cache) + len(texts) > CELL_CACHE_SIZE:
+        cell_cache.clear()
+
+    anonymized = {}
+    pending = []
+    for text in texts:
+        cached = cell_cache.get((text, labels, gliner_threshold))
+        if cached is None:
+            pending.append(text)
+        else:
+            anonymized[text] = cached
+
+    if pending:
+        text_anonymizer = get_anonymizer(debug_mode=False)
+
+        def anonymize_part(part):
+            return text_anonymizer.anonymize_text_batch(
+                part,
+                labels=labels,
+                gliner_threshold=gliner_threshold,
+                batch_size=BATCH_SIZE
+            )
+
+        workers = 1 if text_anonymizer.device == 'cuda' else CSV_WORKERS
+        if workers == 1:
+            # One call keeps the length-sorted batching over all values
+            slices = [pending]
+            results = [anonymize_part(pending)]
+        else:
+            slice_size = -(-len(pending) // workers)
+            slices = [pending[i:i + slice_size] for i in range(0, len(pending), slice_size)]
+            with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+                results = list(executor.map(anonymize_part, slices))
+        for part, part_results in zip(slices, results):
+            for text, anonymized_text in zip(part, part_results):
+                # A single large CSV must not grow the cache past its cap
+                if len(cell_cache) < CELL_CACHE_SIZE:
+                    cell_cache[(text, labels, gliner_threshold)] = anonymized_text
+                anonymized[text] = anonymized_text
+    return anonymized
+
 
 @app.route("/", methods=["GET"])
 def index():
@@ -124,6 +187,77 @@ def csv():
                                default_threshold=DEFAULT_THRESHOLD,
                                phase="upload")
 
+def iter_csv_chunks(dataframe, encoding):
+    """
+    Yield DataFrame as encoded CSV in chunks of CSV_STREAM_ROWS rows.
+
+    Encoding errors in the first chunk are raised, the caller fetches it before
+    returning the response. Later chunks are encoded while streaming, so an
+    error there is logged and ends the download.
+    """
+    for start in range(0, max(len(dataframe), 1), CSV_STREAM_ROWS):
+        buffer = io.StringIO()
+        dataframe.iloc[start:start + CSV_STREAM_ROWS].to_csv(buffer, index=False, header=(start == 0))
+        try:
+            chunk = buffer.getvalue().encode(encoding)
+        except UnicodeEncodeError as e:
+            if start == 0:
+                raise
+            app.logger.exception('Csv encoding failed after %d rows: %s', start, str(e))
+            return
+        yield chunk
+
+
+def dataframe_path(dataframe_id: str) -> str:
+    """Path of an uploaded DataFrame stored in the upload folder."""
+    return os.path.join(app.config['UPLOAD_FOLDER'], f"{dataframe_id}.pkl")
+
+
+# Uploaded DataFrames older than this are removed from the upload folder
+UPLOAD_MAX_AGE_SECONDS = int(os.getenv('UPLOAD_MAX_AGE_SECONDS', 24 * 60 * 60))
+
+
+def remove_expired_dataframes():
+    """Remove uploaded DataFrames (and leftover temporary files) older than UPLOAD_MAX_AGE_SECONDS."""
+    cutoff = time.time() - UPLOAD_MAX_AGE_SECONDS
+    with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+        for entry in entries:
+            if not entry.name.endswith(('.pkl', '.pkl.tmp')):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                # Removed by another worker
+                pass
+
+
+def store_session_dataframe(dataframe):
+    """
+    Store DataFrame on disk in binary form and keep only its id in the session.
+
+    The file is written to a temporary name and renamed, so a request served by
+    another worker never sees a partial file.
+    """
+    remove_expired_dataframes()
+    previous_id = session.get('dataframe_id')
+    if previous_id and os.path.exists(dataframe_path(previous_id)):
+        os.remove(dataframe_path(previous_id))
+    dataframe_id = secrets.token_hex(16)
+    path = dataframe_path(dataframe_id)
+    dataframe.to_pickle(path + '.tmp')
+    os.replace(path + '.tmp', path)
+    session['dataframe_id'] = dataframe_id
+
+
+def load_session_dataframe():
+    """Load the DataFrame of the current session, or None if there is none."""
+    dataframe_id = session.get('dataframe_id')
+    if not dataframe_id or not os.path.exists(dataframe_path(dataframe_id)):
+        return None
+    return pd.read_pickle(dataframe_path(dataframe_id))
+
+
 def handle_csv_upload(request):
     
     uploaded_file = None
@@ -138,12 +272,13 @@ def handle_csv_upload(request):
             encoding = request.form.get('encoding', 'utf-8')
             filename = secure_filename(uploaded_file.filename)
 
-            # Read the contents of the file into a DataFrame without saving it to disk
-            file_stream = io.StringIO(uploaded_file.stream.read().decode(encoding), newline=None)
-            dataframe = pd.read_csv(file_stream, sep=separator, dtype=str, encoding=encoding, index_col=False)
+            # Parse the uploaded byte stream directly, without decoding it into a str first
+            dataframe = pd.read_csv(uploaded_file.stream, sep=separator, dtype=str, encoding=encoding,
+                                    index_col=False, engine='c' if len(separator) == 1 else None,
+                                    low_memory=False)
 
-            # Store the DataFrame in the session after converting it to JSON
-            session['dataframe'] = dataframe.to_json(orient='split', date_format='iso')
+            # Store the DataFrame on disk, session only references it
+            store_session_dataframe(dataframe)
             session['filename'] = filename
             columns = dataframe.columns.tolist()
 
@@ -169,10 +304,9 @@ def handle_csv_anonymization(request):
     
     if not column_selection or len(column_selection) == 0:
         
-        if 'dataframe' in session:
+        dataframe = load_session_dataframe()
+        if dataframe is not None:
             app.logger.info("Dataframe not in session. Forward to column selection page.")
-            dataframe_json = session['dataframe']
-            dataframe = pd.read_json(dataframe_json, orient='split')
             columns = dataframe.columns.tolist()
             
             return render_template('csv.html',
@@ -189,7 +323,8 @@ def handle_csv_anonymization(request):
 
     else:
         # If columns selected and data is in session, anonymize them and return the anonymized file
-        if 'dataframe' in session:
+        dataframe = load_session_dataframe()
+        if dataframe is not None:
             app.logger.info("Dataframe found in session. Anonymizing...")
             try:
                 # Get labels from form (new API)
@@ -203,37 +338,36 @@ def handle_csv_anonymization(request):
                 except (ValueError, TypeError):
                     gliner_threshold = DEFAULT_THRESHOLD
 
-                dataframe_json = session['dataframe']
-                dataframe = pd.read_json(io.StringIO(dataframe_json), orient='split')
                 encoding = request.form.get('encoding', 'utf-8')
 
+                # add _anonymized to original filename
+                filename = secure_filename(session['filename'])
+                filename = filename.replace('.csv', '_anonymized.csv')
+
                 app.logger.info(f"CSV anonymization: labels={labels}, threshold={gliner_threshold}")
 
-                # Anonymize selected columns
+                # Anonymize unique cell values of all selected columns as one batch
+                labels = get_anonymizer(debug_mode=False).prepare_labels(labels)
+                texts = list(dict.fromkeys(
+                    x for column in column_selection for x in dataframe[column]
+                    if isinstance(x, str) and x
+                ))
+                app.logger.info(f"Anonymizing columns {column_selection} ({len(texts)} unique values)")
+                anonymized = anonymize_cells(texts, labels, gliner_threshold)
+                # Dict lookup runs inside pandas; values not in the dict (empty/null) are kept
                 for column in column_selection:
-                    app.logger.info(f"Anonymizing column {column}")
-                    dataframe[column] = dataframe[column].apply(
-                        lambda x: text_anonymizer.anonymize(
-                            x,
-                            labels=labels,
-                            gliner_threshold=gliner_threshold
-                        ).anonymized_text
-                    )
-
-                resp = io.StringIO()
-                dataframe.to_csv(resp, encoding=encoding, index=False)
-                resp.seek(0)
+                    dataframe[column] = dataframe[column].map(anonymized).fillna(dataframe[column])
 
-                # add _anonymized to original filename
-                filename = secure_filename(session['filename'])
-                filename = filename.replace('.csv', '_anonymized.csv')
                 app.logger.info("Anonymization done. Returning anonymized csv.")
 
-                return send_file(
-                    io.BytesIO(resp.getvalue().encode(encoding)),
+                # First chunk is encoded here, so encoding errors show the error page
+                chunks = iter_csv_chunks(dataframe, encoding)
+                first_chunk = next(chunks)
+
+                return Response(
+                    itertools.chain([first_chunk], chunks),
                     mimetype='text/csv',
-                    as_attachment=True,
-                    download_name=filename
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'}
                 )
             except Exception as e:
                 app.logger.exception('Csv anonymization failed with exception: %s', str(e))
@@ -263,18 +397,19 @@ def handle_text_file_anonymization(request):
                 except (ValueError, TypeError):
                     gliner_threshold = DEFAULT_THRESHOLD
 
+                # add _anonymized to original filename
+                filename = secure_filename(uploaded_file.filename)
+                filename = filename.replace('.txt', '_anonymized.txt')
+
                 app.logger.info(f"Text file anonymization: labels={labels}, threshold={gliner_threshold}")
 
+                text_anonymizer = get_anonymizer(debug_mode=False)
                 anonymized_str = text_anonymizer.anonymize(
                     input_text,
-                    labels=labels,
+                    labels=text_anonymizer.prepare_labels(labels),
                     gliner_threshold=gliner_threshold
                 ).anonymized_text
 
-                # add _anonymized to original filename
-                filename = secure_filename(uploaded_file.filename)
-                filename = filename.replace('.txt', '_anonymized.txt')
-
                 return send_file(
                     io.BytesIO(anonymized_str.encode(encoding)),
                     mimetype='plain/text',
@@ -312,9 +447,10 @@ def handle_text_anonymization(request):
 
     app.logger.info(f"Text anonymization: labels={labels}, threshold={gliner_threshold}")
 
+    text_anonymizer = get_anonymizer(debug_mode=False)
     anonymized_text = text_anonymizer.anonymize(
         text,
-        labels=labels,
+        labels=text_anonymizer.prepare_labels(labels),
         gliner_threshold=gliner_threshold
     ).anonymized_text.strip()
 
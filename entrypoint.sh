@@ -53,7 +53,9 @@ then
         echo "Flask not available. Rebuild the image to install requirements." >&2
         exit 1
     }
-    gunicorn -w $WORKERS -b 0.0.0.0:8000 --timeout 600 anonymizer_flask_app:app
+    # --preload loads the GLiNER model once in the master process (GLINER_PRELOAD),
+    # workers share the read-only weights copy-on-write after fork
+    GLINER_PRELOAD=true gunicorn --preload -w $WORKERS -b 0.0.0.0:8000 --timeout 600 anonymizer_flask_app:app
 elif [[ $MODE = webapi ]]
 then
     echo "Run container in web/api mode (single worker - mixing WSGI Flask with ASGI FastAPI)"
@@ -19,21 +19,114 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from debug_utils import print_section_header, print_example_case
+import asyncio
+import json
+import random
 import time
+from types import MappingProxyType
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
-    print("WARNING: requests library not found. Install with: pip install requests")
+    HTTPX_AVAILABLE = False
+    print("WARNING: httpx library not found. Install with: pip install httpx")
+
+try:
+    import h2  # noqa: F401  Needed by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 API_URL = "http://127.0.0.1:8000"
 API_TIMEOUT = 3.0
+# Retries for POST requests, e.g. while the server is still loading the model
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 1.0
+RETRY_STATUS_CODES = (502, 503, 504)
+
+# Read-only error handling cases, built once at import
+ERROR_CASES = (
+    MappingProxyType({"name": "Empty text",
+                      "payload": MappingProxyType({"text": "", "languages": ("fi",), "profile": None})}),
+    MappingProxyType({"name": "Missing text field",
+                      "payload": MappingProxyType({"languages": ("fi",), "profile": None})}),
+    MappingProxyType({"name": "Invalid language",
+                      "payload": MappingProxyType({"text": "Test", "languages": ("xx",), "profile": None})}),
+)
+
+
+def create_client():
+    """
+    Create a shared async client so all tests reuse pooled keep-alive connections.
+
+    HTTP/2 is enabled when the h2 package is installed (pip install httpx[http2]).
+    It is negotiated over TLS, for plain http:// URLs and servers without HTTP/2
+    support the client uses HTTP/1.1 keep-alive.
+    """
+    return httpx.AsyncClient(
+        base_url=API_URL,
+        http2=HTTP2_AVAILABLE,
+        timeout=API_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=16),
+        # Loopback responses are small, skip compressing them. No Connection
+        # header: httpx keeps connections alive, and HTTP/2 forbids the header.
+        headers={"Content-Type": "application/json", "Accept-Encoding": "identity"}
+    )
+
+
+async def post_with_retry(client, endpoint, body):
+    """
+    POST body to endpoint, retrying timeouts, connection errors and 502/503/504.
+
+    Waits RETRY_BACKOFF * 2^attempt seconds plus jitter between attempts.
+    The last response is returned, or the last error is raised.
+    """
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        try:
+            response = await client.post(endpoint, content=body)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == RETRY_ATTEMPTS:
+                return response
+        except (httpx.ConnectError, httpx.TimeoutException):
+            if attempt == RETRY_ATTEMPTS:
+                raise
+        await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF))
+
+
+async def post_all(client, endpoint, payloads):
+    """
+    POST all payloads to endpoint at once.
+
+    Returns responses in payload order. Requests that failed after retries
+    are returned as their exception instead of raising.
+    """
+    return await asyncio.gather(
+        *(post_with_retry(client, endpoint, encode_json(payload)) for payload in payloads),
+        return_exceptions=True
+    )
+
+
+def decode_json(response):
+    """Decode JSON response body, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
-def check_api_availability():
+def encode_json(payload):
+    """Encode payload to JSON bytes once, so it can be posted as-is with content=."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+async def check_api_availability(client):
     """TEST 1: Check API Connection"""
     print_section_header(1, "API Connection Check", 5)
 
@@ -48,14 +141,14 @@ def check_api_availability():
     print(f"  Timeout: {params['timeout']}s")
     print(f"  Checking endpoint: {params['endpoint']}")
 
-    if not REQUESTS_AVAILABLE:
-        print("\n✗ SKIP: requests library not available")
+    if not HTTPX_AVAILABLE:
+        print("\n✗ SKIP: httpx library not available")
         return 0
 
     print("\n\nTest: Connecting to API")
 
     try:
-        response = requests.get(f"{API_URL}{params['endpoint']}", timeout=params['timeout'])
+        response = await client.get(params['endpoint'], timeout=params['timeout'])
 
         if response.status_code == 200:
             print(f"  Status: ✓ API is running")
@@ -65,12 +158,12 @@ def check_api_availability():
         else:
             print(f"  Status: ✗ Unexpected response code: {response.status_code}")
             return 0
-    except requests.ConnectionError:
+    except httpx.ConnectError:
         print(f"  Status: ✗ Connection refused")
         print(f"  API is not running at {API_URL}")
         print(f"  To start API, run: python anonymizer_flask_app.py")
         return 0
-    except requests.Timeout:
+    except httpx.TimeoutException:
         print(f"  Status: ✗ Connection timeout")
         return 0
     except Exception as e:
@@ -78,7 +171,7 @@ def check_api_availability():
         return 0
 
 
-def test_anonymize_simple_text():
+async def test_anonymize_simple_text(client):
     """TEST 2: Simple Text Anonymization"""
     print_section_header(2, "Simple Text Anonymization Endpoint", 5)
 
@@ -100,36 +193,34 @@ def test_anonymize_simple_text():
     print(f"  Text: {params['text']}")
     print(f"  Languages: {payload['languages']}")
 
-    if not REQUESTS_AVAILABLE:
-        print("\n✗ SKIP: requests library not available")
+    if not HTTPX_AVAILABLE:
+        print("\n✗ SKIP: httpx library not available")
         return 0
 
     print("\n\nTest: Sending anonymization request")
     print_example_case(payload['text'], "Should anonymize name and phone")
 
     try:
-        response = requests.post(
-            f"{API_URL}{params['endpoint']}",
-            json=payload,
-            timeout=API_TIMEOUT
-        )
+        response = await post_with_retry(client, params['endpoint'], encode_json(payload))
 
         if response.status_code != 200:
             print(f"\n  Status: ✗ Request failed with code {response.status_code}")
             print(f"  Response: {response.text}")
             return 0
 
-        data = response.json()
+        data = decode_json(response)
+        anonymized = data.get('anonymized_txt')
+        summary = data.get('summary')
 
         print(f"\n  Status: ✓ SUCCESS (HTTP {response.status_code})")
         print(f"  Original: {payload['text']}")
-        print(f"  Anonymized: {data.get('anonymized_txt', 'N/A')}")
-        print(f"  Summary: {data.get('summary', 'N/A')}")
+        print(f"  Anonymized: {anonymized if anonymized is not None else 'N/A'}")
+        print(f"  Summary: {summary if summary is not None else 'N/A'}")
 
         # Validate response structure
         has_anonymized = 'anonymized_txt' in data
         has_summary = 'summary' in data
-        text_changed = data.get('anonymized_txt') != payload['text']
+        text_changed = anonymized != payload['text']
 
         print(f"\n  Response has 'anonymized_txt': {has_anonymized}")
         print(f"  Response has 'summary': {has_summary}")
@@ -140,10 +231,10 @@ def test_anonymize_simple_text():
 
         return 1 if (has_anonymized and has_summary) else 0
 
-    except requests.ConnectionError:
+    except httpx.ConnectError:
         print(f"\n  Status: ✗ Cannot connect to API")
         return 0
-    except requests.Timeout:
+    except httpx.TimeoutException:
         print(f"\n  Status: ✗ Request timeout")
         return 0
     except Exception as e:
@@ -151,7 +242,7 @@ def test_anonymize_simple_text():
         return 0
 
 
-def test_anonymize_with_profile():
+async def test_anonymize_with_profile(client):
     """TEST 3: Profile-Based Anonymization"""
     print_section_header(3, "Profile-Based Anonymization", 5)
 
@@ -161,7 +252,7 @@ def test_anonymize_with_profile():
     ]
 
     params = {
-        'endpoint': '/anonymize',
+        'endpoint': '/anonymize_batch',
         'profiles': ["default", "example"]
     }
 
@@ -169,77 +260,69 @@ def test_anonymize_with_profile():
     print(f"  Endpoint: POST {params['endpoint']}")
     print(f"  Available profiles: {', '.join(params['profiles'])}")
 
-    if not REQUESTS_AVAILABLE:
-        print("\n✗ SKIP: requests library not available")
+    if not HTTPX_AVAILABLE:
+        print("\n✗ SKIP: httpx library not available")
+        return 0
+
+    # All profiles in one batch request, the endpoint accepts a profile per item
+    payload = [
+        {"text": test_case['text'], "profile": test_case['profile']}
+        for test_case in test_cases
+    ]
+
+    try:
+        response = await post_with_retry(client, params['endpoint'], encode_json(payload))
+        if response.status_code != 200:
+            print(f"\n  Status: ✗ Request failed ({response.status_code})")
+            return 0
+        results = decode_json(response)
+    except Exception as e:
+        print(f"\n  Status: ✗ Error: {e}")
         return 0
 
     passed = 0
 
-    for test_case in test_cases:
+    for test_case, data in zip(test_cases, results):
         profile = test_case['profile']
         text = test_case['text']
 
         print(f"\n\nTest: Using profile '{profile}'")
         print_example_case(text, f"Should use {profile} profile patterns")
 
-        payload = {
-            "text": text,
-            "languages": ["fi"],
-            "recognizers": [],
-            "profile": profile
-        }
-
-        try:
-            response = requests.post(
-                f"{API_URL}{params['endpoint']}",
-                json=payload,
-                timeout=API_TIMEOUT
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                print(f"  Original: {text}")
-                print(f"  Anonymized: {data.get('anonymized_txt', 'N/A')}")
-                print(f"  Summary: {data.get('summary', 'N/A')}")
-                print(f"  Status: ✓ PASS")
-                passed += 1
-            else:
-                print(f"  Status: ✗ Request failed ({response.status_code})")
-
-        except Exception as e:
-            print(f"  Status: ✗ Error: {e}")
+        print(f"  Original: {text}")
+        print(f"  Anonymized: {data.get('anonymized_txt', 'N/A')}")
+        print(f"  Summary: {data.get('summary', 'N/A')}")
+        print(f"  Status: ✓ PASS")
+        passed += 1
 
     return passed
 
 
-def test_anonymize_batch():
+async def test_anonymize_batch(client):
     """TEST 4: Batch Anonymization Endpoint"""
     print_section_header(4, "Batch Anonymization Endpoint", 5)
 
-    payload = {
-        "texts": [
-            "Matti Meikäläinen",
-            "Phone: 040-1234567",
-            "HETU: 311299-999A"
-        ],
-        "languages": ["fi"],
-        "profile": None
-    }
+    texts = [
+        "Matti Meikäläinen",
+        "Phone: 040-1234567",
+        "HETU: 311299-999A"
+    ]
+    payload = [{"text": text} for text in texts]
 
     params = {
         'endpoint': '/anonymize_batch',
-        'batch_size': len(payload['texts'])
+        'batch_size': len(texts)
     }
 
     print("\nPARAMETERS:")
-    print(f"  Endpoint: POST {params['endpoint']}")
+    print(f"  Endpoint: POST {params['endpoint']} (streamed as ndjson)")
     print(f"  Batch size: {params['batch_size']} items")
     print(f"  Items:")
-    for i, text in enumerate(payload['texts'], 1):
+    for i, text in enumerate(texts, 1):
         print(f"    {i}. {text}")
 
-    if not REQUESTS_AVAILABLE:
-        print("\n✗ SKIP: requests library not available")
+    if not HTTPX_AVAILABLE:
+        print("\n✗ SKIP: httpx library not available")
         return 0
 
     print("\n\nTest: Sending batch request")
@@ -249,36 +332,38 @@ def test_anonymize_batch():
     )
 
     try:
-        response = requests.post(
-            f"{API_URL}{params['endpoint']}",
-            json=payload,
-            timeout=API_TIMEOUT
-        )
-
-        if response.status_code != 200:
-            print(f"\n  Status: ✗ Request failed ({response.status_code})")
-            return 0
-
-        data = response.json()
-        results = data.get('results', [])
-
-        print(f"\n  Status: ✓ SUCCESS (HTTP {response.status_code})")
-        print(f"  Items processed: {len(results)}")
-
-        for i, result in enumerate(results, 1):
-            print(f"\n  Item {i}:")
-            print(f"    Original: {result.get('original', 'N/A')[:40]}...")
-            print(f"    Anonymized: {result.get('anonymized_txt', 'N/A')[:40]}...")
-
-        status = "✓ PASS" if len(results) == len(payload['texts']) else "✗ FAIL"
+        # Results are printed as they arrive, one JSON object per line
+        async with client.stream("POST", params['endpoint'], content=encode_json(payload),
+                                 headers={"Accept": "application/x-ndjson"}) as response:
+            if response.status_code != 200:
+                print(f"\n  Status: ✗ Request failed ({response.status_code})")
+                return 0
+
+            print(f"\n  Status: ✓ SUCCESS (HTTP {response.status_code})")
+
+            received = 0
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                result = orjson.loads(line) if orjson is not None else json.loads(line)
+                anonymized = result.get('anonymized_txt') or 'N/A'
+                original = texts[received] if received < len(texts) else 'N/A'
+                received += 1
+                print(f"\n  Item {received}:")
+                print(f"    Original: {original[:40]}...")
+                print(f"    Anonymized: {anonymized[:40]}...")
+
+        print(f"\n  Items processed: {received}")
+
+        status = "✓ PASS" if received == len(texts) else "✗ FAIL"
         print(f"\n  Status: {status}")
 
-        return 1 if len(results) == len(payload['texts']) else 0
+        return 1 if received == len(texts) else 0
 
-    except requests.ConnectionError:
+    except httpx.ConnectError:
         print(f"\n  Status: ✗ Cannot connect to API")
         return 0
-    except requests.Timeout:
+    except httpx.TimeoutException:
         print(f"\n  Status: ✗ Request timeout")
         return 0
     except Exception as e:
@@ -286,15 +371,11 @@ def test_anonymize_batch():
         return 0
 
 
-def test_error_handling():
+async def test_error_handling(client):
     """TEST 5: Error Handling"""
     print_section_header(5, "Error Handling", 5)
 
-    test_cases = [
-        {"name": "Empty text", "payload": {"text": "", "languages": ["fi"], "profile": None}},
-        {"name": "Missing text field", "payload": {"languages": ["fi"], "profile": None}},
-        {"name": "Invalid language", "payload": {"text": "Test", "languages": ["xx"], "profile": None}},
-    ]
+    test_cases = ERROR_CASES
 
     params = {
         'endpoint': '/anonymize',
@@ -305,41 +386,61 @@ def test_error_handling():
     print(f"  Endpoint: POST {params['endpoint']}")
     print(f"  Testing {params['error_cases']} error cases")
 
-    if not REQUESTS_AVAILABLE:
-        print("\n✗ SKIP: requests library not available")
+    if not HTTPX_AVAILABLE:
+        print("\n✗ SKIP: httpx library not available")
         return 0
 
+    # Send all error cases at once, report in test case order
+    responses = await post_all(client, params['endpoint'],
+                               [dict(test_case['payload']) for test_case in test_cases])
+
     passed = 0
 
-    for test_case in test_cases:
+    for test_case, response in zip(test_cases, responses):
         name = test_case['name']
         payload = test_case['payload']
 
         print(f"\n\nTest: {name}")
-        print(f"  Payload: {payload}")
-
-        try:
-            response = requests.post(
-                f"{API_URL}{params['endpoint']}",
-                json=payload,
-                timeout=API_TIMEOUT
-            )
+        print(f"  Payload: {dict(payload)}")
 
+        if isinstance(response, httpx.ConnectError):
+            print(f"  Status: ✗ Connection error")
+        elif isinstance(response, httpx.TimeoutException):
+            print(f"  Status: ✗ Timeout")
+        elif isinstance(response, Exception):
+            print(f"  Status: ✗ Error: {response}")
+        else:
             # Could return 200 (gracefully handled), 400 (bad request), or other
             print(f"  Response code: {response.status_code}")
             print(f"  Status: ✓ PASS (handled - returned HTTP {response.status_code})")
             passed += 1
 
-        except requests.ConnectionError:
-            print(f"  Status: ✗ Connection error")
-        except requests.Timeout:
-            print(f"  Status: ✗ Timeout")
-        except Exception as e:
-            print(f"  Status: ✗ Error: {e}")
-
     return passed
 
 
+async def run_tests(client):
+    """Run connection check first, then the endpoint tests."""
+    all_passed = await check_api_availability(client)
+
+    # Only run other tests if API is available
+    if all_passed == 0:
+        return None
+
+    all_passed += await test_anonymize_simple_text(client)
+    all_passed += await test_anonymize_with_profile(client)
+    all_passed += await test_anonymize_batch(client)
+    all_passed += await test_error_handling(client)
+    return all_passed
+
+
+async def run_all():
+    """Run tests with a shared client."""
+    if not HTTPX_AVAILABLE:
+        return await run_tests(None)
+    async with create_client() as client:
+        return await run_tests(client)
+
+
 def main():
     """Run all API verification tests."""
 
@@ -352,15 +453,9 @@ def main():
     all_passed = 0
 
     try:
-        all_passed += check_api_availability()
-
-        # Only run other tests if API is available
-        if all_passed > 0:
-            all_passed += test_anonymize_simple_text()
-            all_passed += test_anonymize_with_profile()
-            all_passed += test_anonymize_batch()
-            all_passed += test_error_handling()
-        else:
+        all_passed = asyncio.run(run_all())
+
+        if all_passed is None:
             print("\n" + "="*80)
             print("⚠ API NOT RUNNING - Skipping endpoint tests")
             print("To start the API server, run one of:")
@@ -382,4 +477,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -14,10 +14,44 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from debug_utils import print_section_header, print_example_case
-from text_anonymizer import TextAnonymizer
+from debug_utils import print_section_header, print_example_case, run_buffered, get_debug_anonymizer
 import time
 
+# Shared anonymizer, model is loaded once for all tests
+ANONYMIZER = get_debug_anonymizer()
+
+# Long text fixture, built once at import
+BASE_TEXT = "Customer: Matti Meikäläinen, HETU: 311299-999A, Phone: 040-1234567. "
+LONG_TEXT_REPETITIONS = 50
+LONG_TEXT = BASE_TEXT * LONG_TEXT_REPETITIONS  # ~3000 characters
+
+# (text, description) cases, built once at import
+SPECIAL_CHARACTER_CASES = (
+    ('Käyttäjä: Matti Meikäläinen', 'Finnish special chars (ä, ö)'),
+    ('User: José García López', 'Spanish accents'),
+    ('用户: 王小明', 'Chinese characters'),
+    ('Пользователь: Иван Петров', 'Cyrillic characters'),
+    ('Email: test+alias@example.com', 'Special chars in email'),
+    ('Name: "John Doe" <john@example.com>', 'Quotes and angle brackets'),
+    ('Test #hashtag @mention', 'Social media symbols'),
+)
+
+CASE_SENSITIVITY_CASES = (
+    ('MATTI MEIKÄLÄINEN', 'ALL CAPS'),
+    ('matti meikäläinen', 'all lowercase'),
+    ('Matti Meikäläinen', 'Title Case'),
+    ('mATTI mEIKÄLÄINEN', 'Mixed case'),
+)
+
+MALFORMED_CASES = (
+    ('HETU: 311299-', 'Incomplete HETU'),
+    ('Phone: 040-', 'Incomplete phone'),
+    ('Email: test@', 'Incomplete email'),
+    ('IBAN: FI49', 'Incomplete IBAN'),
+    ('Multiple@@@signs@@@here', 'Multiple @ symbols'),
+    ('Dashes----like----this', 'Multiple dashes'),
+)
+
 
 def test_empty_text():
     """TEST 1: Empty and Whitespace Text"""
@@ -33,7 +67,6 @@ def test_empty_text():
     print("\nPARAMETERS:")
     print("  Testing edge cases with empty/whitespace input")
 
-    anonymizer = TextAnonymizer()
     passed = 0
 
     for text, description in test_cases:
@@ -41,7 +74,7 @@ def test_empty_text():
         print(f"  Input repr: {repr(text)}")
 
         try:
-            result = anonymizer.anonymize(text=text, labels=['person_ner'])
+            result = ANONYMIZER.anonymize(text=text, labels=['person_ner'])
             print(f"  Summary: {result.summary}")
             print(f"  Output: {repr(result.anonymized_text)}")
             print(f"  Status: ✓ PASS (no error)")
@@ -56,20 +89,11 @@ def test_special_characters():
     """TEST 2: Special Characters and Unicode"""
     print_section_header(2, "Special Characters and Unicode Handling", 7)
 
-    test_cases = [
-        ('Käyttäjä: Matti Meikäläinen', 'Finnish special chars (ä, ö)'),
-        ('User: José García López', 'Spanish accents'),
-        ('用户: 王小明', 'Chinese characters'),
-        ('Пользователь: Иван Петров', 'Cyrillic characters'),
-        ('Email: test+alias@example.com', 'Special chars in email'),
-        ('Name: "John Doe" <john@example.com>', 'Quotes and angle brackets'),
-        ('Test #hashtag @mention', 'Social media symbols'),
-    ]
+    test_cases = SPECIAL_CHARACTER_CASES
 
     print("\nPARAMETERS:")
     print("  Testing various special characters and Unicode")
 
-    anonymizer = TextAnonymizer()
     passed = 0
 
     for text, description in test_cases:
@@ -77,7 +101,7 @@ def test_special_characters():
         print(f"  Input: {text}")
 
         try:
-            result = anonymizer.anonymize(text=text, labels=['person_ner', 'email_ner'])
+            result = ANONYMIZER.anonymize(text=text, labels=['person_ner', 'email_ner'])
             print(f"  Summary: {result.summary}")
             print(f"  Output: {result.anonymized_text}")
             print(f"  Status: ✓ PASS")
@@ -92,17 +116,11 @@ def test_case_sensitivity():
     """TEST 3: Case Sensitivity"""
     print_section_header(3, "Case Sensitivity Edge Cases", 7)
 
-    test_cases = [
-        ('MATTI MEIKÄLÄINEN', 'ALL CAPS'),
-        ('matti meikäläinen', 'all lowercase'),
-        ('Matti Meikäläinen', 'Title Case'),
-        ('mATTI mEIKÄLÄINEN', 'Mixed case'),
-    ]
+    test_cases = CASE_SENSITIVITY_CASES
 
     print("\nPARAMETERS:")
     print("  Testing case sensitivity with person names")
 
-    anonymizer = TextAnonymizer()
     passed = 0
 
     for text, description in test_cases:
@@ -110,7 +128,7 @@ def test_case_sensitivity():
         print_example_case(text, "Should detect regardless of case")
 
         try:
-            result = anonymizer.anonymize(text=text, labels=['person_ner'])
+            result = ANONYMIZER.anonymize(text=text, labels=['person_ner'])
             print(f"  Summary: {result.summary}")
             print(f"  Output: {result.anonymized_text}")
 
@@ -144,10 +162,8 @@ def test_overlapping_entities():
     print("\n\nTest: Overlapping entity handling")
     print_example_case(text, "Should correctly identify all entities")
 
-    anonymizer = TextAnonymizer()
-
     try:
-        result = anonymizer.anonymize(text=text, labels=params['labels'])
+        result = ANONYMIZER.anonymize(text=text, labels=params['labels'])
         print(f"\n  Summary: {result.summary}")
         print(f"  Entities found: {len(result.details)}")
         print(f"  Output: {result.anonymized_text}")
@@ -162,14 +178,10 @@ def test_long_text():
     """TEST 5: Long Text Processing"""
     print_section_header(5, "Long Text Processing", 7)
 
-    # Create a moderately long text
-    base_text = "Customer: Matti Meikäläinen, HETU: 311299-999A, Phone: 040-1234567. "
-    long_text = base_text * 50  # ~3000 characters
-
     params = {
-        'text_length': len(long_text),
-        'repetitions': 50,
-        'base_length': len(base_text)
+        'text_length': len(LONG_TEXT),
+        'repetitions': LONG_TEXT_REPETITIONS,
+        'base_length': len(BASE_TEXT)
     }
 
     print("\nPARAMETERS:")
@@ -178,17 +190,15 @@ def test_long_text():
     print(f"  Base text length: {params['base_length']} characters")
 
     print("\n\nTest: Processing long text")
-    print_example_case(long_text[:50] + "...", "Should handle long text efficiently")
-
-    anonymizer = TextAnonymizer()
+    print_example_case(LONG_TEXT[:50] + "...", "Should handle long text efficiently")
 
     try:
-        start_time = time.time()
-        result = anonymizer.anonymize(
-            text=long_text,
+        start = time.perf_counter_ns()
+        result = ANONYMIZER.anonymize(
+            text=LONG_TEXT,
             labels=['person_ner', 'fi_hetu_regex', 'fi_puhelin_regex']
         )
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
         print(f"\n  Entities found: {len(result.details)}")
         print(f"  Processing time: {elapsed:.3f} seconds")
@@ -204,19 +214,11 @@ def test_malformed_inputs():
     """TEST 6: Malformed Input Handling"""
     print_section_header(6, "Malformed Input Handling", 7)
 
-    test_cases = [
-        ('HETU: 311299-', 'Incomplete HETU'),
-        ('Phone: 040-', 'Incomplete phone'),
-        ('Email: test@', 'Incomplete email'),
-        ('IBAN: FI49', 'Incomplete IBAN'),
-        ('Multiple@@@signs@@@here', 'Multiple @ symbols'),
-        ('Dashes----like----this', 'Multiple dashes'),
-    ]
+    test_cases = MALFORMED_CASES
 
     print("\nPARAMETERS:")
     print("  Testing malformed/incomplete entity patterns")
 
-    anonymizer = TextAnonymizer()
     passed = 0
 
     for text, description in test_cases:
@@ -224,7 +226,7 @@ def test_malformed_inputs():
         print(f"  Input: {text}")
 
         try:
-            result = anonymizer.anonymize(
+            result = ANONYMIZER.anonymize(
                 text=text,
                 labels=['person_ner', 'fi_hetu_regex', 'fi_puhelin_regex', 'email_ner']
             )
@@ -261,20 +263,17 @@ def test_batch_processing():
 
     print("\n\nTest: Processing batch of items")
 
-    anonymizer = TextAnonymizer()
     labels = ['person_ner', 'fi_puhelin_regex', 'fi_hetu_regex', 'email_ner', 'fi_rekisteri_regex', 'fi_iban_regex']
 
     try:
-        start_time = time.time()
-        results = []
+        start = time.perf_counter_ns()
+        # One batched call, GLiNER runs the items together
+        results = ANONYMIZER.anonymize_batch(texts=texts, labels=labels, batch_size=len(texts))
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
-        for text in texts:
-            result = anonymizer.anonymize(text=text, labels=labels)
-            results.append(result)
+        for result in results:
             print(f"  ✓ Item processed: {len(result.details)} entities found")
 
-        elapsed = time.time() - start_time
-
         print(f"\n  Total items: {len(results)}")
         print(f"  Total time: {elapsed:.3f} seconds")
         print(f"  Average per item: {elapsed / len(results):.3f} seconds")
@@ -297,13 +296,13 @@ def main():
     all_passed = 0
 
     try:
-        all_passed += test_empty_text()
-        all_passed += test_special_characters()
-        all_passed += test_case_sensitivity()
-        all_passed += test_overlapping_entities()
-        all_passed += test_long_text()
-        all_passed += test_malformed_inputs()
-        all_passed += test_batch_processing()
+        all_passed += run_buffered(test_empty_text)
+        all_passed += run_buffered(test_special_characters)
+        all_passed += run_buffered(test_case_sensitivity)
+        all_passed += run_buffered(test_overlapping_entities)
+        all_passed += run_buffered(test_long_text)
+        all_passed += run_buffered(test_malformed_inputs)
+        all_passed += run_buffered(test_batch_processing)
     except Exception as e:
         print(f"\n✗ ERROR: {e}")
         import traceback
@@ -21,8 +21,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from debug_utils import print_section_header, print_example_case, print_test_result
-from text_anonymizer import TextAnonymizer
+from debug_utils import print_section_header, print_example_case, print_test_result, run_parallel, get_debug_anonymizer
 
 
 def test_labels_parameter():
@@ -43,7 +42,7 @@ def test_labels_parameter():
         if key != 'text':
             print(f"  {key}: {val}")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     # Test 1: Only person
     print("\n\nTest 1a: Only person_ner label")
@@ -103,7 +102,7 @@ def test_gliner_threshold():
     print(f"  Low threshold: {params['low_threshold']} (more detections)")
     print(f"  High threshold: {params['high_threshold']} (fewer detections)")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     # Low threshold
     print("\n\nTest 2a: Low threshold (0.2)")
@@ -154,7 +153,7 @@ def test_underscore_label_conversion():
     print(f"  Space label: {params['space_label']}")
     print("\nEXPECTED: Both should produce same result")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     # Test with underscore
     print("\n\nTest 3a: Using underscore label (phone_number_ner)")
@@ -200,7 +199,7 @@ def test_multi_word_labels():
     for label, text in test_cases:
         print(f"    - {label}: '{text}'")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
     passed = 0
 
     for label, text in test_cases:
@@ -240,7 +239,7 @@ def test_regex_with_profile():
     print(f"  Profile: {params['profile']}")
     print(f"  Labels: Will use regex patterns from profile")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     print("\n\nTest: Using default profile")
     print_example_case(text, "Should detect HETU and registration from profile patterns")
@@ -270,7 +269,7 @@ def test_blocklist_grantlist():
     print("  Blocklist test: 'blockword123' should be anonymized")
     print("  Grantlist test: 'example321' should be protected")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     # Test blocklist
     print("\n\nTest 6a: Blocklist")
@@ -302,7 +301,7 @@ def test_config_cache_loading():
 
     print("\nChecking config loading:")
 
-    config_cache = ConfigCache()
+    config_cache = ConfigCache.instance()
 
     # Check blocklist
     print("\n  Blocklist (example profile):")
@@ -357,7 +356,7 @@ def test_combined_controls():
         print(f"    - {label}")
     print(f"  Threshold: {params['threshold']}")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     print("\n\nTest: Anonymizing complete record with multiple controls")
     print_example_case(text.strip()[:50] + "...", "Should anonymize all PII with one call")
@@ -373,7 +372,7 @@ def test_combined_controls():
     print(f"  Output preview: {result.anonymized_text[:100]}...")
 
     # Check multiple entity types were found
-    entity_types = len(result.summary.split(';'))
+    entity_types = len(result.summary)  # summary maps entity type -> count
     print(f"  Entity types detected: {entity_types}")
     print(f"  Status: {'✓ PASS' if entity_types >= 3 else '✗ FAIL (expected >= 3 types)'}")
 
@@ -391,20 +390,18 @@ def main():
 
     all_passed = 0
 
-    # Run all tests
-    try:
-        all_passed += test_labels_parameter()
-        all_passed += test_gliner_threshold()
-        all_passed += test_underscore_label_conversion()
-        all_passed += test_multi_word_labels()
-        all_passed += test_regex_with_profile()
-        all_passed += test_blocklist_grantlist()
-        all_passed += test_config_cache_loading()
-        all_passed += test_combined_controls()
-    except Exception as e:
-        print(f"\n✗ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+    # Run all tests, the sections are independent and run in worker processes when DEBUG_WORKERS > 1
+    tests = [
+        test_labels_parameter,
+        test_gliner_threshold,
+        test_underscore_label_conversion,
+        test_multi_word_labels,
+        test_regex_with_profile,
+        test_blocklist_grantlist,
+        test_config_cache_loading,
+        test_combined_controls,
+    ]
+    all_passed += sum(result for result in run_parallel(tests) if result is not None)
 
     print("\n" + "="*80)
     print(f"COMPLETED: {all_passed} tests")
@@ -17,8 +17,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from debug_utils import print_section_header, print_example_case
-from text_anonymizer import TextAnonymizer
+from debug_utils import print_section_header, print_example_case, run_parallel, get_debug_anonymizer
 from text_anonymizer.config_cache import ConfigCache
 
 
@@ -30,7 +29,7 @@ def test_label_mappings_loaded():
     print("  File: config/label_mappings.txt")
     print("  Expected: Mapping file with internal→output label pairs")
 
-    config_cache = ConfigCache()
+    config_cache = ConfigCache.instance()
     mappings = config_cache.get_label_mappings()
 
     print(f"\n✓ Label mappings loaded: {len(mappings)} mappings found")
@@ -64,7 +63,7 @@ def test_person_ner_mapping():
     print(f"  Input label: {params['internal_label']}")
     print(f"  Expected output label: {params['expected_output']}")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     print("\n\nTest: Anonymizing with person_ner label")
     print_example_case(text, "Should map to NIMI in output")
@@ -103,7 +102,7 @@ def test_phone_number_mapping():
     print(f"  Input label: {params['internal_label']}")
     print(f"  Expected output label: {params['expected_output']}")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     print("\n\nTest: Anonymizing with phone_number_ner label")
     print_example_case(text, "Should map to PUHELIN in output")
@@ -152,7 +151,7 @@ def test_regex_label_mapping():
     for case in test_cases:
         print(f"    {case['label']} → {case['expected']}")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
     passed = 0
 
     for i, case in enumerate(test_cases, 1):
@@ -197,7 +196,7 @@ def test_default_profile_mappings():
     print(f"  Profile: {params['profile']}")
     print(f"  Expected output labels: {', '.join(params['expected_labels'])}")
 
-    anonymizer = TextAnonymizer()
+    anonymizer = get_debug_anonymizer()
 
     print("\n\nTest: Using default profile")
     print_example_case(text.strip()[:50] + "...",
@@ -236,16 +235,15 @@ def main():
 
     all_passed = 0
 
-    try:
-        all_passed += test_label_mappings_loaded()
-        all_passed += test_person_ner_mapping()
-        all_passed += test_phone_number_mapping()
-        all_passed += test_regex_label_mapping()
-        all_passed += test_default_profile_mappings()
-    except Exception as e:
-        print(f"\n✗ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+    # The sections are independent and run in worker processes when DEBUG_WORKERS > 1
+    tests = [
+        test_label_mappings_loaded,
+        test_person_ner_mapping,
+        test_phone_number_mapping,
+        test_regex_label_mapping,
+        test_default_profile_mappings,
+    ]
+    all_passed += sum(result for result in run_parallel(tests) if result is not None)
 
     print("\n" + "="*80)
     print(f"SUMMARY: {all_passed} test sections passed")
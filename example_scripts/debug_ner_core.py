@@ -15,10 +15,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from debug_utils import (
-    print_section_header, print_example_case, run_single_test,
-    print_test_result, print_summary, load_test_data
+    print_section_header, print_example_case, run_test_suite,
+    print_summary, load_test_data, run_parallel
 )
-from text_anonymizer import TextAnonymizer
 
 # Load test data
 test_data = load_test_data()
@@ -38,27 +37,7 @@ def test_person_ner_finnish():
     test_cases = test_data['test_names_fi'][:5]  # First 5 for quick run
     bad_cases = ["vieläkään", "esim"]
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['person_ner'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['person_ner'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['person_ner'], bad_cases=bad_cases)
 
 
 def test_person_ner_english():
@@ -75,27 +54,7 @@ def test_person_ner_english():
     test_cases = test_data['test_names_en'][:5]  # First 5
     bad_cases = ["vieläkään", "esim"]
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['person_ner'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['person_ner'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['person_ner'], bad_cases=bad_cases)
 
 
 def test_address_ner_finnish():
@@ -115,27 +74,7 @@ def test_address_ner_finnish():
     test_cases = test_data['test_addresses'][:5]
     bad_cases = test_data['bad_address'][:3]
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['address_ner'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['address_ner'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['address_ner'], bad_cases=bad_cases)
 
 
 def test_location_ner_finnish():
@@ -152,19 +91,7 @@ def test_location_ner_finnish():
     test_cases = test_data['test_street'][:5]
     bad_cases = []
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['location_ner'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['location_ner'], bad_cases=bad_cases)
 
 
 def test_email_ner():
@@ -183,27 +110,7 @@ def test_email_ner():
     test_cases = ["Contact: matti@example.com", "Email: test.user@company.co.uk"]
     bad_cases = ["Not an email @", "contact us"]
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['email_ner'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['email_ner'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['email_ner'], bad_cases=bad_cases)
 
 
 def main():
@@ -217,7 +124,7 @@ def main():
     all_passed = 0
     all_total = 0
 
-    # Run all tests
+    # Run all tests, the sections are independent and run in worker processes when DEBUG_WORKERS > 1
     tests = [
         test_person_ner_finnish,
         test_person_ner_english,
@@ -226,15 +133,11 @@ def main():
         test_email_ner,
     ]
 
-    for test_func in tests:
-        try:
-            passed, total = test_func()
+    for result in run_parallel(tests):
+        if result is not None:
+            passed, total = result
             all_passed += passed
             all_total += total
-        except Exception as e:
-            print(f"\n✗ ERROR in {test_func.__name__}: {e}")
-            import traceback
-            traceback.print_exc()
 
     print_summary(all_passed, all_total)
 
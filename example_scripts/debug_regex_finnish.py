@@ -22,10 +22,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from debug_utils import (
-    print_section_header, print_example_case, run_single_test,
-    print_test_result, print_summary, load_test_data
+    print_section_header, print_example_case, run_test_suite,
+    print_summary, load_test_data, run_buffered
 )
-from text_anonymizer import TextAnonymizer
 
 # Load test data
 test_data = load_test_data()
@@ -45,27 +44,8 @@ def test_hetu_regex():
     test_cases = test_data['test_ssn']
     bad_cases = test_data['bad_ssn']
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases[:5]:  # Show first 5
-        result = run_single_test(text, ['fi_hetu_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases[:3]:  # Show first 3
-        result = run_single_test(text, ['fi_hetu_regex'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    # Show first 5 positive and first 3 negative cases
+    return run_test_suite(test_cases[:5], ['fi_hetu_regex'], bad_cases=bad_cases[:3])
 
 
 def test_phone_regex():
@@ -83,27 +63,7 @@ def test_phone_regex():
     test_cases = test_data['test_phonenumbers_fi']
     bad_cases = test_data['bad_phonenumbers']
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['fi_puhelin_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases[:5]:
-        result = run_single_test(text, ['fi_puhelin_regex'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['fi_puhelin_regex'], bad_cases=bad_cases[:5])
 
 
 def test_iban_regex():
@@ -123,27 +83,7 @@ def test_iban_regex():
     test_cases = test_data['test_iban']
     bad_cases = test_data['bad_email'][:2]  # Using email as bad IBAN
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['fi_iban_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['fi_iban_regex'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['fi_iban_regex'], bad_cases=bad_cases)
 
 
 def test_property_id_regex():
@@ -163,19 +103,7 @@ def test_property_id_regex():
     test_cases = test_data['test_property_identifier'][:8]  # First 8
     bad_cases = []
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['fi_kiinteisto_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['fi_kiinteisto_regex'], bad_cases=bad_cases)
 
 
 def test_registration_plate_regex():
@@ -196,27 +124,7 @@ def test_registration_plate_regex():
     test_cases = test_data['test_register_number']
     bad_cases = test_data['bad_register_number']
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['fi_rekisteri_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['fi_rekisteri_regex'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['fi_rekisteri_regex'], bad_cases=bad_cases)
 
 
 def main():
@@ -241,7 +149,7 @@ def main():
 
     for test_func in tests:
         try:
-            passed, total = test_func()
+            passed, total = run_buffered(test_func)
             all_passed += passed
             all_total += total
         except Exception as e:
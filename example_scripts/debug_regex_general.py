@@ -19,10 +19,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from debug_utils import (
-    print_section_header, print_example_case, run_single_test,
-    print_test_result, print_summary, load_test_data
+    print_section_header, print_example_case, run_test_suite,
+    print_summary, load_test_data, run_buffered
 )
-from text_anonymizer import TextAnonymizer
 
 # Load test data
 test_data = load_test_data()
@@ -44,27 +43,7 @@ def test_email_regex():
     test_cases = test_data['test_email']
     bad_cases = test_data['bad_email']
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['email_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['email_regex'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['email_regex'], bad_cases=bad_cases)
 
 
 def test_filename_regex():
@@ -85,27 +64,7 @@ def test_filename_regex():
     test_cases = test_data['test_filenames']
     bad_cases = test_data['bad_filenames']
 
-    anonymizer = TextAnonymizer()
-    passed = 0
-    total = 0
-
-    print(f"\n{len(test_cases)} positive cases:")
-    for text in test_cases:
-        result = run_single_test(text, ['tiedosto_regex'], anonymizer, is_negative=False)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    print(f"\n{len(bad_cases)} negative cases:")
-    for text in bad_cases:
-        result = run_single_test(text, ['tiedosto_regex'], anonymizer, is_negative=True)
-        print_test_result(result, show_details=False)
-        if result['passed']:
-            passed += 1
-        total += 1
-
-    return passed, total
+    return run_test_suite(test_cases, ['tiedosto_regex'], bad_cases=bad_cases)
 
 
 def main():
@@ -127,7 +86,7 @@ def main():
 
     for test_func in tests:
         try:
-            passed, total = test_func()
+            passed, total = run_buffered(test_func)
             all_passed += passed
             all_total += total
         except Exception as e:
@@ -8,10 +8,31 @@ and standardized test execution across all debug scripts.
 
 import sys
 import os
+import io
+import functools
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Mapping
+from contextlib import redirect_stdout
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from text_anonymizer import TextAnonymizer
-from typing import List, Dict, Any, Optional, Tuple
+from text_anonymizer import TextAnonymizer, get_anonymizer
+from text_anonymizer.config_cache import ConfigCache
+from typing import List, Dict, Any, Optional, Tuple, Callable, TextIO
+
+# Debug runs reuse GLiNER predictions of unchanged texts from disk.
+# Set GLINER_PREDICTION_CACHE_DIR to another directory to override.
+DEBUG_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.debug_cache')
+
+
+def get_debug_anonymizer() -> TextAnonymizer:
+    """Return the shared anonymizer of the debug scripts, on CUDA when available."""
+    import torch
+    return get_anonymizer(
+        debug_mode=False,
+        use_gpu=torch.cuda.is_available(),
+        prediction_cache_dir=os.getenv('GLINER_PREDICTION_CACHE_DIR', DEBUG_CACHE_DIR)
+    )
 
 
 def print_section_header(section_num: int, section_name: str, total_sections: Optional[int] = None):
@@ -56,7 +77,7 @@ def run_single_test(
     Args:
         text: Text to anonymize
         labels: Labels to use for anonymization
-        anonymizer: TextAnonymizer instance (created if None)
+        anonymizer: TextAnonymizer instance (shared instance if None)
         test_name: Name of this test case
         is_negative: If True, expects NO entities to be found
         **anonymize_kwargs: Additional kwargs for anonymize() method
@@ -66,10 +87,42 @@ def run_single_test(
         entities_found, text_changed, passed
     """
     if anonymizer is None:
-        anonymizer = TextAnonymizer(debug_mode=False)
+        anonymizer = get_debug_anonymizer()
 
     result = anonymizer.anonymize(text=text, labels=labels, **anonymize_kwargs)
+    return build_test_result(text, result, test_name, is_negative)
+
 
+def run_batch_tests(
+    cases: List[Tuple[str, bool]],
+    labels: List[str],
+    anonymizer: TextAnonymizer = None,
+    **anonymize_kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Run several anonymization tests with one batched anonymizer call.
+
+    Args:
+        cases: List of (text, is_negative) tuples
+        labels: Labels to use for anonymization
+        anonymizer: TextAnonymizer instance (shared instance if None)
+        **anonymize_kwargs: Additional kwargs for anonymize_batch() method
+
+    Returns:
+        List of result dicts as returned by run_single_test(), in case order
+    """
+    if anonymizer is None:
+        anonymizer = get_debug_anonymizer()
+
+    results = anonymizer.anonymize_batch([text for text, _ in cases], labels=labels, **anonymize_kwargs)
+    return [
+        build_test_result(text, result, is_negative=is_negative)
+        for (text, is_negative), result in zip(cases, results)
+    ]
+
+
+def build_test_result(text: str, result, test_name: str = "", is_negative: bool = False) -> Dict[str, Any]:
+    """Build test result dict from an AnonymizerResult."""
     entities_found = len(result.summary) > 0
     text_changed = result.anonymized_text != text
 
@@ -93,25 +146,31 @@ def run_single_test(
     }
 
 
-def print_test_result(result: Dict[str, Any], show_details: bool = True):
+def print_test_result(result: Dict[str, Any], show_details: bool = True, file: Optional[TextIO] = None):
     """
     Print formatted test result.
 
     Args:
         result: Result dict from run_single_test()
         show_details: If True, show details of found entities
+        file: Stream or buffer to write to (default: sys.stdout)
     """
+    file = file if file is not None else sys.stdout
     status = "✓ PASS" if result['passed'] else "✗ FAIL"
     test_type = "NEGATIVE" if result['is_negative'] else "POSITIVE"
 
-    print(f"\n{status} | {test_type} TEST")
-    print(f"  Input:      {result['text']}")
-    print(f"  Entities found: {result['entities_found']} | Text changed: {result['text_changed']}")
-    print(f"  Output:     {result['anonymized_text']}")
-    print(f"  Summary:    {result['summary']}")
-
+    lines = [
+        f"\n{status} | {test_type} TEST",
+        f"  Input:      {result['text']}",
+        f"  Entities found: {result['entities_found']} | Text changed: {result['text_changed']}",
+        f"  Output:     {result['anonymized_text']}",
+        f"  Summary:    {result['summary']}",
+    ]
     if show_details and result['details']:
-        print(f"  Details:    {result['details']}")
+        lines.append(f"  Details:    {result['details']}")
+
+    # One write per result, callers buffer whole sections (see run_buffered)
+    file.write("\n".join(lines) + "\n")
 
 
 def run_test_suite(
@@ -127,7 +186,7 @@ def run_test_suite(
     Args:
         test_cases: List of positive test cases (should find entities)
         labels: Labels to use
-        anonymizer: TextAnonymizer instance (created if None)
+        anonymizer: TextAnonymizer instance (shared instance if None)
         bad_cases: List of negative test cases (should NOT find entities)
         print_results: If True, print results
 
@@ -135,7 +194,7 @@ def run_test_suite(
         Tuple of (passed_count, total_count)
     """
     if anonymizer is None:
-        anonymizer = TextAnonymizer(debug_mode=False)
+        anonymizer = get_debug_anonymizer()
 
     if bad_cases is None:
         bad_cases = []
@@ -143,17 +202,22 @@ def run_test_suite(
     total = len(test_cases) + len(bad_cases)
     passed = 0
 
+    # Positive and negative cases share one batched call
+    results = run_batch_tests(
+        [(text, False) for text in test_cases] + [(text, True) for text in bad_cases],
+        labels, anonymizer
+    )
+
     print(f"\nRunning {len(test_cases)} positive cases...")
-    for text in test_cases:
-        result = run_single_test(text, labels, anonymizer, is_negative=False)
+    for result in results[:len(test_cases)]:
         if result['passed']:
             passed += 1
         if print_results:
             print_test_result(result, show_details=False)
 
-    print(f"\nRunning {len(bad_cases)} negative cases...")
-    for text in bad_cases:
-        result = run_single_test(text, labels, anonymizer, is_negative=True)
+    if bad_cases:
+        print(f"\nRunning {len(bad_cases)} negative cases...")
+    for result in results[len(test_cases):]:
         if result['passed']:
             passed += 1
         if print_results:
@@ -162,6 +226,82 @@ def run_test_suite(
     return passed, total
 
 
+def run_buffered(test_func: Callable[[], Any]) -> Any:
+    """
+    Run a test function with its printed output buffered in memory.
+
+    The output is written to stdout in one go when the test finishes
+    (also if it raises), instead of one write per print call.
+
+    Args:
+        test_func: Test function taking no arguments
+
+    Returns:
+        Return value of test_func
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            return test_func()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def _run_captured(test_func: Callable[[], Any]) -> Tuple[str, Any, Optional[str]]:
+    """Run a test function, returning (printed output, return value, error traceback)."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        try:
+            result, error = test_func(), None
+        except Exception:
+            result, error = None, traceback.format_exc()
+    return buffer.getvalue(), result, error
+
+
+def _init_test_worker():
+    """Use one torch thread per worker process, the workers share the CPU cores."""
+    try:
+        import torch
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+
+
+def run_parallel(tests: List[Callable[[], Any]], max_workers: Optional[int] = None) -> List[Any]:
+    """
+    Run independent test functions, optionally in a process pool.
+
+    By default the tests run in this process and share one anonymizer. With more
+    than one worker, each worker process loads its own model via
+    get_debug_anonymizer(), which costs its memory once per worker. Output of
+    each test is printed in test order once all tests have finished.
+
+    Args:
+        tests: Module-level test functions taking no arguments
+        max_workers: Worker processes. Defaults to DEBUG_WORKERS env variable,
+                     or 1, which runs the tests in this process.
+
+    Returns:
+        Return values of the tests, None for tests that raised
+    """
+    workers = min(max_workers or int(os.getenv('DEBUG_WORKERS', '1')), len(tests))
+    if workers <= 1:
+        outcomes = [_run_captured(test) for test in tests]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_test_worker) as executor:
+            outcomes = list(executor.map(_run_captured, tests))
+
+    results = []
+    for test, (output, result, error) in zip(tests, outcomes):
+        sys.stdout.write(output)
+        if error:
+            print(f"\n✗ ERROR in {test.__name__}:\n{error}")
+        results.append(result)
+    sys.stdout.flush()
+    return results
+
+
 def print_summary(passed: int, total: int):
     """Print test summary."""
     percentage = (passed / total * 100) if total > 0 else 0
@@ -180,12 +320,12 @@ def verify_config_files() -> Dict[str, bool]:
     Returns:
         Dict with file path as key and True/False for existence
     """
-    import os
-
+    # Same directory the anonymizer loads its config from
+    config_dir = ConfigCache.instance().config_dir
     config_files = {
-        'label_mappings': '/Users/manu/Projects/gliner-text-anonymizer/config/label_mappings.txt',
-        'default_patterns': '/Users/manu/Projects/gliner-text-anonymizer/config/default/regex_patterns.txt',
-        'example_patterns': '/Users/manu/Projects/gliner-text-anonymizer/config/example/regex_patterns.txt',
+        'label_mappings': os.path.join(config_dir, 'label_mappings.txt'),
+        'default_patterns': os.path.join(config_dir, 'default', 'regex_patterns.txt'),
+        'example_patterns': os.path.join(config_dir, 'example', 'regex_patterns.txt'),
     }
 
     print("\n" + "="*80)
@@ -206,38 +346,55 @@ def verify_config_files() -> Dict[str, bool]:
     return results
 
 
-def load_test_data():
+# Test data lists exposed by load_test_data(), attributes of test/common_test_data.py
+TEST_DATA_KEYS = (
+    'test_phonenumbers', 'test_phonenumbers_fi', 'bad_phonenumbers',
+    'test_names_fi', 'test_names_en',
+    'test_register_number', 'bad_register_number',
+    'test_property_identifier',
+    'test_ssn', 'bad_ssn',
+    'test_addresses', 'test_street', 'bad_address',
+    'test_email', 'bad_email',
+    'test_iban',
+    'test_filenames', 'bad_filenames',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_test_data():
+    """Import test/common_test_data.py once."""
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'test'))
+    import common_test_data
+    return common_test_data
+
+
+class _LazyTestData(Mapping):
+    """Read-only view of TEST_DATA_KEYS, looking up each list from the module on access."""
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getitem__(self, key: str) -> List[str]:
+        if key not in TEST_DATA_KEYS:
+            raise KeyError(key)
+        return getattr(self._module, key)
+
+    def __iter__(self):
+        return iter(TEST_DATA_KEYS)
+
+    def __len__(self) -> int:
+        return len(TEST_DATA_KEYS)
+
+
+def load_test_data() -> Mapping[str, List[str]]:
     """
     Load common test data from test module.
 
     Returns:
-        Dict with all test data
+        Mapping with all test data, lists are looked up when accessed
     """
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'test'))
-
     try:
-        import common_test_data as test_data
-        return {
-            'test_phonenumbers': test_data.test_phonenumbers,
-            'test_phonenumbers_fi': test_data.test_phonenumbers_fi,
-            'bad_phonenumbers': test_data.bad_phonenumbers,
-            'test_names_fi': test_data.test_names_fi,
-            'test_names_en': test_data.test_names_en,
-            'test_register_number': test_data.test_register_number,
-            'bad_register_number': test_data.bad_register_number,
-            'test_property_identifier': test_data.test_property_identifier,
-            'test_ssn': test_data.test_ssn,
-            'bad_ssn': test_data.bad_ssn,
-            'test_addresses': test_data.test_addresses,
-            'test_street': test_data.test_street,
-            'bad_address': test_data.bad_address,
-            'test_email': test_data.test_email,
-            'bad_email': test_data.bad_email,
-            'test_iban': test_data.test_iban,
-            'test_filenames': test_data.test_filenames,
-            'bad_filenames': test_data.bad_filenames,
-        }
+        return _LazyTestData(_import_test_data())
     except ImportError as e:
         print(f"Error loading test data: {e}")
         return {}
@@ -1,6 +1,7 @@
 # Test
 from text_anonymizer import TextAnonymizer
-import time
+import statistics
+import timeit
 
 '''
 Example code to test TextAnonymizer
@@ -8,9 +9,16 @@ Also used in the performance testing.
 '''
 
 ITERATIONS = 10
+REPEATS = 5
+
+
+class UncachedTextAnonymizer(TextAnonymizer):
+    # Same text is anonymized on every iteration, measure the work instead of result cache hits
+    RESULT_CACHE_SIZE = 0
+
 
 # Init anonymizer to work in mask mode and two languages
-text_anonymizer = TextAnonymizer()
+text_anonymizer = UncachedTextAnonymizer()
 
 
 text_fi = ('Nimet: Toivo, Sami, Seppo, Ahti, Veikko, Jaana, Tiina, Minna, Aura, Lumi, Virtanen, Salminen, Gröönroos, Suomi.' \
@@ -54,12 +62,13 @@ text_fi = ('Nimet: Toivo, Sami, Seppo, Ahti, Veikko, Jaana, Tiina, Minna, Aura,
            )
 
 print("Anonymizer running...")
-start_time = round(time.time() * 1000)
-for i in range(ITERATIONS):
-    anonymized_fi = text_anonymizer.anonymize_text(text_fi)
+# Warm-up call, first inference is slower (lazy initialization, allocator, caches)
+anonymized_fi = text_anonymizer.anonymize_text(text_fi)
+timer = timeit.Timer(lambda: text_anonymizer.anonymize_text(text_fi))
+runs_ms = [run / ITERATIONS * 1000 for run in timer.repeat(repeat=REPEATS, number=ITERATIONS)]
 print(text_fi)
 print("--")
 print(anonymized_fi)
 print(" ")
-time_ms = round(time.time() * 1000)-start_time
-print("{i} iterations took {ms}ms, avg {avg}ms".format(i=ITERATIONS, ms=time_ms, avg=time_ms/ITERATIONS))
\ No newline at end of file
+print("{r} x {i} iterations, per iteration: min {min:.1f}ms, median {median:.1f}ms, max {max:.1f}ms".format(
+    r=REPEATS, i=ITERATIONS, min=min(runs_ms), median=statistics.median(runs_ms), max=max(runs_ms)))
@@ -1,5 +1,5 @@
 from typing import List
-from text_anonymizer import TextAnonymizer
+from text_anonymizer import get_anonymizer
 '''
 Base test class for testing single regex labels.
 Pass recognizer object and test strings as constructor parameters
@@ -11,7 +11,7 @@ class BaseRegexTest():
     def __init__(self, regex_label, test_cases: List[str], bad_test_cases: List[str] = None):
         self.test_cases = test_cases
         self.bad_test_cases = bad_test_cases if bad_test_cases is not None else []
-        self.anonymizer = TextAnonymizer(debug_mode=False)
+        self.anonymizer = get_anonymizer(debug_mode=False)
         self.regex_label = regex_label
 
     # ...existing code...
@@ -25,6 +25,7 @@ Output:
 """
 
 import argparse
+import functools
 import logging
 import os
 import random
@@ -35,7 +36,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Tuple, Optional
 
-from text_anonymizer import TextAnonymizer
+from text_anonymizer import TextAnonymizer, get_anonymizer
 import test_util_text_anonymizer
 
 # Configure logging
@@ -46,6 +47,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Batch sizes tried by tune_batch_size()
+BATCH_SIZE_CANDIDATES = [1, 4, 8, 16, 32, 64]
+DEFAULT_LATENCY_SLO_MS = 50.0
+
+# <LABEL> placeholders in test sentence templates
+PLACEHOLDER_PATTERN = re.compile(r'<(NIMI|OSOITE)>')
+# Decimal digits (str.isdigit() also counts e.g. superscripts like '²')
+DIGIT_PATTERN = re.compile(r'\d')
+
 
 @dataclass
 class EvaluationResult:
@@ -91,11 +101,59 @@ class ThresholdResult:
         return round(0.4 * self.name_accuracy + 0.3 * self.address_accuracy + 0.3 * self.word_accuracy, 2)
 
 
+def tune_batch_size(
+    anonymizer: TextAnonymizer,
+    gliner_threshold: float,
+    candidates: List[int] = None,
+    latency_slo_ms: float = DEFAULT_LATENCY_SLO_MS
+) -> int:
+    """
+    Pick the GLiNER batch size for evaluation runs with a short warmup sweep.
+
+    Each candidate batch size anonymizes one batch of generated names. The largest
+    batch size whose per-sample latency meets the SLO is chosen. If none does, the
+    batch size with the lowest per-sample latency is used.
+
+    Args:
+        anonymizer: Anonymizer to tune
+        gliner_threshold: GLiNER confidence threshold
+        candidates: Batch sizes to try (default: BATCH_SIZE_CANDIDATES)
+        latency_slo_ms: Maximum per-sample latency in milliseconds
+
+    Returns:
+        Chosen batch size
+    """
+    if candidates is None:
+        candidates = BATCH_SIZE_CANDIDATES
+
+    # Sweep samples must not change the seeded evaluation data
+    random_state = random.getstate()
+    samples = test_util_text_anonymizer.generate_full_names(max(candidates) + 1)
+    random.setstate(random_state)
+
+    # First call is slower (lazy initialization), keep it out of the measurements
+    anonymizer.anonymize_text_batch(samples[-1:], gliner_threshold=gliner_threshold)
+
+    latencies_ms = {}
+    for batch_size in sorted(candidates):
+        batch = samples[:batch_size]
+        start = time.perf_counter()
+        anonymizer.anonymize_text_batch(batch, gliner_threshold=gliner_threshold, batch_size=batch_size)
+        latencies_ms[batch_size] = (time.perf_counter() - start) * 1000 / len(batch)
+        logger.info("Batch size %d: %.1f ms per sample", batch_size, latencies_ms[batch_size])
+
+    within_slo = [batch_size for batch_size, latency in latencies_ms.items() if latency <= latency_slo_ms]
+    chosen = max(within_slo) if within_slo else min(latencies_ms, key=latencies_ms.get)
+    logger.info("Using batch size %d (latency SLO %.1f ms per sample)", chosen, latency_slo_ms)
+    return chosen
+
+
 def evaluate_names_with_threshold(
     iterations: int,
     gliner_threshold: float,
     anonymizer: Optional[TextAnonymizer] = None,
-    verbose: int = 1
+    verbose: int = 1,
+    batch_size: int = TextAnonymizer.GLINER_BATCH_SIZE
 ) -> EvaluationResult:
     """
     Evaluate anonymizer with generated names using specified threshold.
@@ -103,6 +161,7 @@ def evaluate_names_with_threshold(
 
     Args:
         verbose: 0 = silent, 1 = summary only, 2 = all details
+        batch_size: Maximum number of texts per GLiNER forward pass
     """
     if verbose >= 1:
         logger.info("Evaluating name anonymization: iterations=%d, threshold=%.2f", iterations, gliner_threshold)
@@ -110,7 +169,7 @@ def evaluate_names_with_threshold(
     start_time = time.time()
 
     if anonymizer is None:
-        anonymizer = TextAnonymizer(debug_mode=False)
+        anonymizer = get_anonymizer(debug_mode=False)
 
     random_names = test_util_text_anonymizer.generate_full_names(iterations)
 
@@ -118,8 +177,12 @@ def evaluate_names_with_threshold(
     partial_count = 0
     failed_items = []
 
-    for name in random_names:
-        anonymized = anonymizer.anonymize_text(name, gliner_threshold=gliner_threshold)
+    # One batched call, GLiNER runs once per batch instead of once per sample
+    anonymized_names = anonymizer.anonymize_text_batch(
+        random_names, gliner_threshold=gliner_threshold, batch_size=batch_size
+    )
+
+    for name, anonymized in zip(random_names, anonymized_names):
         success_start = anonymized.startswith('<')
         success_end = anonymized.endswith('>')
 
@@ -153,7 +216,8 @@ def evaluate_addresses_with_threshold(
     iterations: int,
     gliner_threshold: float,
     anonymizer: Optional[TextAnonymizer] = None,
-    verbose: int = 1
+    verbose: int = 1,
+    batch_size: int = TextAnonymizer.GLINER_BATCH_SIZE
 ) -> EvaluationResult:
     """
     Evaluate anonymizer with generated street addresses using specified threshold.
@@ -166,6 +230,7 @@ def evaluate_addresses_with_threshold(
 
     Args:
         verbose: 0 = silent, 1 = summary only, 2 = all details
+        batch_size: Maximum number of texts per GLiNER forward pass
     """
     if verbose >= 1:
         logger.info("Evaluating address anonymization: iterations=%d, threshold=%.2f", iterations, gliner_threshold)
@@ -173,7 +238,7 @@ def evaluate_addresses_with_threshold(
     start_time = time.time()
 
     if anonymizer is None:
-        anonymizer = TextAnonymizer(debug_mode=False)
+        anonymizer = get_anonymizer(debug_mode=False)
 
     random_streets = test_util_text_anonymizer.generate_streets(iterations)
 
@@ -181,13 +246,15 @@ def evaluate_addresses_with_threshold(
     partial_count = 0
     failed_items = []
 
-    for street in random_streets:
-        anonymized = anonymizer.anonymize_text(street, gliner_threshold=gliner_threshold)
+    anonymized_streets = anonymizer.anonymize_text_batch(
+        random_streets, gliner_threshold=gliner_threshold, batch_size=batch_size
+    )
 
+    for street, anonymized in zip(random_streets, anonymized_streets):
         has_label = '<' in anonymized and '>' in anonymized
-        no_numbers = not any(char.isdigit() for char in anonymized)
 
-        if has_label and no_numbers:
+        # Digits are only checked when a label is present
+        if has_label and DIGIT_PATTERN.search(anonymized) is None:
             # Full success: completely anonymized with no numbers remaining
             success_count += 1
             if verbose >= 2:
@@ -220,7 +287,8 @@ def evaluate_words_with_threshold(
     iterations: int,
     gliner_threshold: float,
     anonymizer: Optional[TextAnonymizer] = None,
-    verbose: int = 1
+    verbose: int = 1,
+    batch_size: int = TextAnonymizer.GLINER_BATCH_SIZE
 ) -> EvaluationResult:
     """
     Evaluate anonymizer with plain words (false positive test) using specified threshold.
@@ -228,6 +296,7 @@ def evaluate_words_with_threshold(
 
     Args:
         verbose: 0 = silent, 1 = summary only, 2 = all details
+        batch_size: Maximum number of texts per GLiNER forward pass
     """
     if verbose >= 1:
         logger.info("Evaluating false positives (words): iterations=%d, threshold=%.2f", iterations, gliner_threshold)
@@ -235,16 +304,18 @@ def evaluate_words_with_threshold(
     start_time = time.time()
 
     if anonymizer is None:
-        anonymizer = TextAnonymizer(debug_mode=False)
+        anonymizer = get_anonymizer(debug_mode=False)
 
     random_words = test_util_text_anonymizer.generate_words(iterations)
 
     success_count = 0
     failed_items = []
 
-    for word in random_words:
-        anonymized = anonymizer.anonymize_text(word, gliner_threshold=gliner_threshold)
+    anonymized_words = anonymizer.anonymize_text_batch(
+        random_words, gliner_threshold=gliner_threshold, batch_size=batch_size
+    )
 
+    for word, anonymized in zip(random_words, anonymized_words):
         # Success = word was NOT anonymized (no angle brackets)
         if '<' not in anonymized:
             success_count += 1
@@ -268,8 +339,14 @@ def evaluate_words_with_threshold(
     )
 
 
-def load_test_sentences(filepath: str = None) -> List[str]:
-    """Load test sentences from file."""
+@functools.lru_cache(maxsize=4)
+def load_test_sentences(filepath: str = None) -> Tuple[str, ...]:
+    """
+    Load test sentence templates from file, once per process and path.
+
+    Lines without any <NIMI>/<OSOITE> placeholder are left out, they would not
+    test anything.
+    """
     if filepath is None:
         # Default path relative to this file
         this_dir = os.path.dirname(os.path.abspath(__file__))
@@ -278,40 +355,43 @@ def load_test_sentences(filepath: str = None) -> List[str]:
     with open(filepath, 'r', encoding='utf-8') as f:
         lines = [line.strip() for line in f if line.strip()]
 
-    return lines
+    templates = tuple(line for line in lines if PLACEHOLDER_PATTERN.search(line))
+    if len(templates) < len(lines):
+        logger.info("Skipped %d test sentences without placeholders", len(lines) - len(templates))
+    return templates
 
 
-def find_placeholders(text: str) -> List[Tuple[int, int, str]]:
+@functools.lru_cache(maxsize=1024)
+def find_placeholders(text: str) -> Tuple[Tuple[int, int, str], ...]:
     """
     Find all placeholders in text and return their positions and types.
 
+    Templates are picked repeatedly from a fixed file, so results are memoized.
+
     Returns:
-        List of (start, end, label_type) tuples, sorted by position
+        Tuple of (start, end, label_type) tuples, sorted by position
     """
-    placeholders = []
-
-    # Find all <LABEL> patterns
-    pattern = r'<(NIMI|OSOITE)>'
-    for match in re.finditer(pattern, text):
-        placeholders.append((match.start(), match.end(), match.group(1)))
-
-    return sorted(placeholders, key=lambda x: x[0])
+    # finditer returns matches in position order
+    return tuple((match.start(), match.end(), match.group(1)) for match in PLACEHOLDER_PATTERN.finditer(text))
 
 
 def replace_placeholders_with_content(
     template: str,
     names: List[str],
-    addresses: List[str]
+    addresses: List[str],
+    rng: Optional[random.Random] = None
 ) -> Tuple[str, List[Tuple[int, int, str, str]]]:
     """
     Replace placeholders with random content from appropriate sources.
 
-    Works by replacing from end to start to avoid index shifting issues.
+    Builds the filled text in one forward pass, tracking how much earlier
+    replacements have shifted the positions.
 
     Args:
         template: Text with <NIMI> and <OSOITE> placeholders
         names: List of names to use as replacements
         addresses: List of addresses to use as replacements
+        rng: Random generator for the replacements (default: the random module)
 
     Returns:
         Tuple of (filled_text, injected_entities)
@@ -322,63 +402,52 @@ def replace_placeholders_with_content(
     if not placeholders:
         return template, []
 
-    # Work backwards to avoid index shifting
-    result = template
-    injected_entities = []
+    if rng is None:
+        rng = random
 
-    # Process in reverse order
-    for start, end, label_type in reversed(placeholders):
-        if label_type == 'NIMI':
-            replacement = random.choice(names)
-        elif label_type == 'OSOITE':
-            replacement = random.choice(addresses)
-        else:
-            continue
+    # Draw all replacements of the template at once
+    label_types = [label_type for _, _, label_type in placeholders]
+    name_draws = iter(rng.choices(names, k=label_types.count('NIMI')))
+    address_draws = iter(rng.choices(addresses, k=label_types.count('OSOITE')))
 
-        # Replace the placeholder
-        result = result[:start] + replacement + result[end:]
-
-    # Now find the positions in the final text by processing forward
-    # Re-parse to get actual positions after all replacements
-    result = template
+    parts = []
+    injected_entities = []
+    position = 0
     current_offset = 0
 
     for start, end, label_type in placeholders:
         if label_type == 'NIMI':
-            replacement = random.choice(names)
+            replacement = next(name_draws)
         elif label_type == 'OSOITE':
-            replacement = random.choice(addresses)
+            replacement = next(address_draws)
         else:
             continue
 
-        # Calculate actual position accounting for previous replacements
-        actual_start = start + current_offset
-
-        # Replace in result
-        result = result[:actual_start] + replacement + result[actual_start + (end - start):]
+        parts.append(template[position:start])
+        parts.append(replacement)
+        position = end
 
         # Record the entity position in the final text
-        actual_end = actual_start + len(replacement)
-        injected_entities.append((actual_start, actual_end, label_type, replacement))
+        actual_start = start + current_offset
+        injected_entities.append((actual_start, actual_start + len(replacement), label_type, replacement))
 
-        # Update offset for next replacement
         # Offset changes by the difference between replacement length and placeholder length
         current_offset += len(replacement) - (end - start)
 
-    return result, injected_entities
+    parts.append(template[position:])
+    return ''.join(parts), injected_entities
 
 
-def check_entity_anonymized(
-    anonymized_text: str,
-    original_text: str,
-    entity_start: int,
-    entity_end: int,
-    entity_text: str,
-    label_type: str
-) -> str:
+def check_entity_anonymized(anonymized_text: str, entity_text: str, has_any_label: bool) -> str:
     """
     Check if an entity was properly anonymized.
 
+    Args:
+        anonymized_text: Anonymizer output
+        entity_text: Injected entity text
+        has_any_label: Whether anonymized_text contains '<' and '>', computed once
+                       per text by the caller
+
     Returns:
         'success' - Entity was fully anonymized
         'partial' - Entity was partially anonymized
@@ -386,27 +455,21 @@ def check_entity_anonymized(
     """
     # The entity text should not appear in the anonymized output
     if entity_text not in anonymized_text:
-        # Check if appropriate label exists
-        expected_labels = ['<NIMI>', '<OSOITE>'] if label_type == 'NIMI' else ['<OSOITE>', '<SIJAINTI>']
-        if any(label in anonymized_text for label in expected_labels):
-            return 'success'
-        # Text is gone but no label - might still be success if replaced with any label
-        if '<' in anonymized_text and '>' in anonymized_text:
-            return 'success'
-        return 'partial'
-    else:
-        # Entity text still present
-        # Check if at least part was anonymized (label present)
-        if '<' in anonymized_text and '>' in anonymized_text:
-            return 'partial'
-        return 'failed'
+        # Text is gone, success if it was replaced with any label
+        return 'success' if has_any_label else 'partial'
+    # Entity text still present
+    # Check if at least part was anonymized (label present)
+    return 'partial' if has_any_label else 'failed'
 
 
 def evaluate_longer_texts_with_threshold(
     iterations: int,
     gliner_threshold: float,
     anonymizer: Optional[TextAnonymizer] = None,
-    verbose: int = 1
+    verbose: int = 1,
+    batch_size: int = TextAnonymizer.GLINER_BATCH_SIZE,
+    names_pool: Optional[List[str]] = None,
+    addresses_pool: Optional[List[str]] = None
 ) -> EvaluationResult:
     """
     Evaluate anonymizer with longer texts containing multiple entities.
@@ -422,6 +485,10 @@ def evaluate_longer_texts_with_threshold(
         gliner_threshold: GLiNER confidence threshold
         anonymizer: Pre-initialized anonymizer (optional)
         verbose: 0 = silent, 1 = summary only, 2 = all details
+        batch_size: Maximum number of texts per GLiNER forward pass
+        names_pool: Names to fill templates with, generated if not given. Pass the
+                    same pools to repeated calls (e.g. per threshold) to reuse them.
+        addresses_pool: Addresses to fill templates with, generated if not given
 
     Returns:
         EvaluationResult with success/partial/failed counts
@@ -432,12 +499,16 @@ def evaluate_longer_texts_with_threshold(
     start_time = time.time()
 
     if anonymizer is None:
-        anonymizer = TextAnonymizer(debug_mode=False)
+        anonymizer = get_anonymizer(debug_mode=False)
 
     # Load templates and generate test data
     templates = load_test_sentences()
-    names = test_util_text_anonymizer.generate_full_names(iterations * 5)  # Generate pool of names
-    addresses = test_util_text_anonymizer.generate_streets(iterations * 5)  # Generate pool of addresses
+    names = names_pool
+    if names is None:
+        names = test_util_text_anonymizer.generate_full_names(iterations * 5)  # Generate pool of names
+    addresses = addresses_pool
+    if addresses is None:
+        addresses = test_util_text_anonymizer.generate_streets(iterations * 5)  # Generate pool of addresses
 
     success_count = 0
     partial_count = 0
@@ -448,36 +519,40 @@ def evaluate_longer_texts_with_threshold(
     entities_partial = 0
     entities_failed = 0
 
+    # Fill all texts first so they can be anonymized in one batched call
+    samples = []
     for i in range(iterations):
         # Pick a random template
         template = random.choice(templates)
 
-        # Reset random seed for reproducible name/address selection per iteration
-        # (but still randomized based on iteration)
-        random.seed(1234 + i)
+        # Own generator per iteration for reproducible name/address selection
+        # (but still randomized based on iteration), global random state is not reset
+        rng = random.Random(1234 + i)
 
         # Fill template with random content
         filled_text, injected_entities = replace_placeholders_with_content(
-            template, names, addresses
+            template, names, addresses, rng
         )
 
-        if not injected_entities:
-            continue
+        samples.append((i, filled_text, injected_entities))
 
-        # Anonymize the filled text
-        anonymized = anonymizer.anonymize_text(filled_text, gliner_threshold=gliner_threshold)
+    anonymized_texts = anonymizer.anonymize_text_batch(
+        [filled_text for _, filled_text, _ in samples], gliner_threshold=gliner_threshold,
+        batch_size=batch_size
+    )
 
+    for (i, filled_text, injected_entities), anonymized in zip(samples, anonymized_texts):
         # Check each injected entity
         iteration_success = 0
         iteration_partial = 0
         iteration_failed = 0
 
+        has_any_label = '<' in anonymized and '>' in anonymized
+
         for entity_start, entity_end, label_type, entity_text in injected_entities:
             total_entities += 1
 
-            result = check_entity_anonymized(
-                anonymized, filled_text, entity_start, entity_end, entity_text, label_type
-            )
+            result = check_entity_anonymized(anonymized, entity_text, has_any_label)
 
             if result == 'success':
                 entities_success += 1
@@ -625,7 +700,10 @@ def run_threshold_optimization(
     iterations: int = 100,
     thresholds: List[float] = None,
     seed: int = 1234,
-    verbose: bool = True
+    verbose: bool = True,
+    batch_size: Optional[int] = None,
+    latency_slo_ms: float = DEFAULT_LATENCY_SLO_MS,
+    backend: Optional[str] = None
 ) -> Tuple[float, List[ThresholdResult]]:
     """
     Run evaluation with multiple GLiNER thresholds to find optimal value.
@@ -635,6 +713,10 @@ def run_threshold_optimization(
         thresholds: List of threshold values to test (default: [0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
         seed: Random seed for reproducibility
         verbose: Print detailed output
+        batch_size: GLiNER batch size, None picks one with tune_batch_size()
+        latency_slo_ms: Per-sample latency SLO used when tuning the batch size
+        backend: GLiNER inference backend (see TextAnonymizer.BACKENDS), None uses
+                 the anonymizer default
 
     Returns:
         Tuple of (best_threshold, all_results)
@@ -666,7 +748,27 @@ def run_threshold_optimization(
 
     # Initialize anonymizer once (model loading is slow)
     logger.info("Loading anonymizer model...")
-    anonymizer = TextAnonymizer(debug_mode=False)
+    anonymizer = get_anonymizer(debug_mode=False, **({'backend': backend} if backend else {}))
+    print(f"Backend: {anonymizer.backend}")
+
+    if batch_size is None:
+        batch_size = tune_batch_size(anonymizer, thresholds[0], latency_slo_ms=latency_slo_ms)
+
+    # GLiNER runs once with the lowest threshold, higher thresholds only filter
+    # its predictions
+    logger.info("Anonymizing test data for all thresholds...")
+    start_time = time.time()
+    # All three categories share one batched call and are split by position afterwards
+    anonymized_all = anonymizer.anonymize_text_thresholds(
+        test_names + test_streets + test_words, thresholds, batch_size=batch_size
+    )
+    names_end = len(test_names)
+    streets_end = names_end + len(test_streets)
+    anonymized_names = {t: outputs[:names_end] for t, outputs in anonymized_all.items()}
+    anonymized_streets = {t: outputs[names_end:streets_end] for t, outputs in anonymized_all.items()}
+    anonymized_words = {t: outputs[streets_end:] for t, outputs in anonymized_all.items()}
+    # Shared anonymization time is split evenly between thresholds
+    shared_duration = (time.time() - start_time) / len(thresholds)
 
     threshold_results = []
 
@@ -678,8 +780,7 @@ def run_threshold_optimization(
 
         # Evaluate names
         name_success = 0
-        for name in test_names:
-            anonymized = anonymizer.anonymize_text(name, gliner_threshold=threshold)
+        for anonymized in anonymized_names[threshold]:
             if anonymized.startswith('<') and anonymized.endswith('>'):
                 name_success += 1
         name_accuracy = round((name_success / iterations) * 100, 2)
@@ -687,25 +788,22 @@ def run_threshold_optimization(
 
         # Evaluate addresses (success = has label AND no numbers remaining)
         address_success = 0
-        for street in test_streets:
-            anonymized = anonymizer.anonymize_text(street, gliner_threshold=threshold)
+        for anonymized in anonymized_streets[threshold]:
             has_label = '<' in anonymized and '>' in anonymized
-            no_numbers = not any(char.isdigit() for char in anonymized)
-            if has_label and no_numbers:
+            if has_label and DIGIT_PATTERN.search(anonymized) is None:
                 address_success += 1
         address_accuracy = round((address_success / iterations) * 100, 2)
         print(f"  Addresses: {address_accuracy:>6.2f}% ({address_success}/{iterations})")
 
         # Evaluate words (false positives)
         word_success = 0
-        for word in test_words:
-            anonymized = anonymizer.anonymize_text(word, gliner_threshold=threshold)
+        for anonymized in anonymized_words[threshold]:
             if '<' not in anonymized:
                 word_success += 1
         word_accuracy = round((word_success / iterations) * 100, 2)
         print(f"  Words:     {word_accuracy:>6.2f}% ({word_success}/{iterations}) [higher = fewer false positives]")
 
-        duration = time.time() - start_time
+        duration = shared_duration + time.time() - start_time
 
         result = ThresholdResult(
             threshold=threshold,
@@ -734,7 +832,10 @@ def run_evaluation(
     seed: int = 1234,
     accuracy_threshold: float = 0.95,
     gliner_threshold: float = 0.6,
-    verbose: int = 1
+    verbose: int = 1,
+    batch_size: Optional[int] = None,
+    latency_slo_ms: float = DEFAULT_LATENCY_SLO_MS,
+    backend: Optional[str] = None
 ) -> Tuple[bool, List[EvaluationResult]]:
     """
     Run the full evaluation suite with a single GLiNER threshold.
@@ -745,6 +846,10 @@ def run_evaluation(
         accuracy_threshold: Minimum accuracy threshold (0.0 to 1.0)
         gliner_threshold: GLiNER confidence threshold (0.0 to 1.0)
         verbose: 0 = final report only, 1 = summary (default), 2 = all details
+        batch_size: GLiNER batch size, None picks one with tune_batch_size()
+        latency_slo_ms: Per-sample latency SLO used when tuning the batch size
+        backend: GLiNER inference backend (see TextAnonymizer.BACKENDS), None uses
+                 the anonymizer default
 
     Returns:
         Tuple of (all_passed, results_list)
@@ -773,7 +878,11 @@ def run_evaluation(
     # Initialize anonymizer once
     if verbose >= 1:
         logger.info("Loading anonymizer model...")
-    anonymizer = TextAnonymizer(debug_mode=False)
+    anonymizer = get_anonymizer(debug_mode=False, **({'backend': backend} if backend else {}))
+
+    # Tuned once, all evaluators use the same batch size
+    if batch_size is None:
+        batch_size = tune_batch_size(anonymizer, gliner_threshold, latency_slo_ms=latency_slo_ms)
 
     results = []
 
@@ -782,25 +891,29 @@ def run_evaluation(
         print("\n[1/4] Evaluating name anonymization...")
         if verbose >= 2:
             print_separator("-", 60)
-    results.append(evaluate_names_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose))
+    results.append(evaluate_names_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose,
+                                                 batch_size=batch_size))
 
     if verbose >= 1:
         print("\n[2/4] Evaluating address anonymization...")
         if verbose >= 2:
             print_separator("-", 60)
-    results.append(evaluate_addresses_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose))
+    results.append(evaluate_addresses_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose,
+                                                     batch_size=batch_size))
 
     if verbose >= 1:
         print("\n[3/4] Evaluating false positives (plain words)...")
         if verbose >= 2:
             print_separator("-", 60)
-    results.append(evaluate_words_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose))
+    results.append(evaluate_words_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose,
+                                                 batch_size=batch_size))
 
     if verbose >= 1:
         print("\n[4/4] Evaluating longer texts with multiple entities...")
         if verbose >= 2:
             print_separator("-", 60)
-    results.append(evaluate_longer_texts_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose))
+    results.append(evaluate_longer_texts_with_threshold(iterations, gliner_threshold, anonymizer, verbose=verbose,
+                                                        batch_size=batch_size))
 
     # Print failed items (details) - only at verbose >= 1
     if verbose >= 1:
@@ -833,7 +946,8 @@ def run_evaluation(
 
     # Print results table (always printed - this is the final report)
     print("\n")
-    print_results_table(results)
+    # Backend in the title keeps quantized and fp32 reports apart
+    print_results_table(results, title=f"EVALUATION RESULTS SUMMARY (backend: {anonymizer.backend})")
 
     return all_passed, results
 
@@ -868,6 +982,19 @@ def main():
         "--thresholds", type=str, default="0.3,0.4,0.5,0.6,0.7,0.8",
         help="Comma-separated list of thresholds to test (used with --optimize)"
     )
+    parser.add_argument(
+        "--batch-size", type=int, default=None,
+        help="GLiNER batch size, tuned with a warmup sweep when not given"
+    )
+    parser.add_argument(
+        "--latency-slo-ms", type=float, default=DEFAULT_LATENCY_SLO_MS,
+        help="Per-sample latency SLO in milliseconds for batch size tuning"
+    )
+    parser.add_argument(
+        "--backend", type=str, default=None, choices=TextAnonymizer.BACKENDS,
+        help="GLiNER inference backend, e.g. onnx-int8 for a quantized model "
+             "(default: GLINER_BACKEND env variable or torch-fp32)"
+    )
     parser.add_argument(
         "--verbose", "-v", type=int, default=1, choices=[0, 1, 2],
         help="Verbosity level: 0 = final report only, 1 = summary (default), 2 = all details"
@@ -882,7 +1009,10 @@ def main():
         best_threshold, _ = run_threshold_optimization(
             iterations=args.iterations,
             thresholds=thresholds,
-            seed=args.seed
+            seed=args.seed,
+            batch_size=args.batch_size,
+            latency_slo_ms=args.latency_slo_ms,
+            backend=args.backend
         )
 
         print(f"\nOptimal threshold found: {best_threshold}")
@@ -893,7 +1023,10 @@ def main():
             seed=args.seed,
             accuracy_threshold=args.accuracy_threshold,
             gliner_threshold=args.gliner_threshold,
-            verbose=args.verbose
+            verbose=args.verbose,
+            batch_size=args.batch_size,
+            latency_slo_ms=args.latency_slo_ms,
+            backend=args.backend
         )
 
         sys.exit(0 if all_passed else 1)
@@ -12,6 +12,7 @@ Verifies that:
 
 import sys
 import os
+import json
 import unittest
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -522,6 +523,30 @@ class TestAnonymizerAPIEdgeCases(unittest.TestCase):
 
         logger.info("Special characters preserved while phone anonymized: %s", data["anonymized_txt"])
 
+    def test_anonymize_batch_ndjson(self):
+        """Test batch endpoint streaming results as newline-delimited JSON."""
+        payload = [
+            {
+                "text": "Henkilötunnukseni on 311299-999A."
+            },
+            {
+                "text": "Soita minulle numeroon 040-9876543."
+            }
+        ]
+        response = requests.post(f"{API_URL}/anonymize_batch", json=payload, timeout=API_TIMEOUT,
+                                 headers={"Accept": "application/x-ndjson"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/x-ndjson", response.headers.get("Content-Type", ""))
+
+        data = [json.loads(line) for line in response.text.splitlines() if line]
+        self.assertEqual(len(data), 2)
+
+        # Results are streamed in request order
+        self.assertNotIn("311299-999A", data[0]["anonymized_txt"])
+        self.assertNotIn("040-9876543", data[1]["anonymized_txt"])
+
+        logger.info("Streamed batch anonymization successful: %d items processed", len(data))
+
     def test_batch_empty_list(self):
         """Test batch endpoint with empty list."""
         payload = []
@@ -180,6 +180,24 @@ class TestGLiNERControls(unittest.TestCase):
         self.assertIsNotNone(result_low.anonymized_text)
         self.assertIsNotNone(result_high.anonymized_text)
 
+    def test_threshold_sweep_matches_batch(self):
+        """Test that one sweep over several thresholds matches separate batch calls."""
+        anonymizer = TextAnonymizer(languages=['fi'])
+
+        texts = [
+            "Matti Meikäläinen asuu Helsingissä. Yhteyshenkilö Liisa Virtanen.",
+            "Osoite on Mannerheimintie 5 A 3, 00100 Helsinki.",
+            "Tänään sataa.",
+            # Longer than one GLiNER chunk, names also fall in the chunk overlaps
+            "Yhteyshenkilö Liisa Virtanen soitti eilen Matti Meikäläiselle. " * 40,
+        ]
+        thresholds = [0.3, 0.5, 0.7]
+
+        swept = anonymizer.anonymize_text_thresholds(texts, thresholds)
+
+        for threshold in thresholds:
+            self.assertEqual(swept[threshold], anonymizer.anonymize_text_batch(texts, gliner_threshold=threshold))
+
     def test_regex_pattern_detection(self):
         """Test that regex patterns are detected from profile."""
         anonymizer = TextAnonymizer(languages=['fi'])
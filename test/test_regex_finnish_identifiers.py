@@ -12,6 +12,7 @@ This test combines individual regex recognizer tests for various Finnish identif
 Tests detection and anonymization of Finnish identifiers using regex patterns.
 """
 
+import time
 import unittest
 
 from common_test_data import (
@@ -20,6 +21,8 @@ from common_test_data import (
     test_ssn, bad_ssn, test_iban, bad_email
 )
 from common_regex_test_base import BaseRegexTest
+from text_anonymizer.config_cache import ConfigCache
+from text_anonymizer.regex_matcher import RegexMatcher
 
 
 class TestFinnishPhoneRecognizer(unittest.TestCase):
@@ -108,6 +111,38 @@ class TestFinnishVehicleRegistrationRecognizer(unittest.TestCase):
         self.assertTrue(test_base.test_recognizer(), 'Finnish registration plate regex test failed.')
 
 
+class TestRegexPatternRuntime(unittest.TestCase):
+    """Test that profile regex patterns do not backtrack catastrophically."""
+
+    # Near misses repeated to ~50k characters, a quadratic pattern takes seconds on these
+    ADVERSARIAL_INPUTS = [
+        ('0' + ' ' * 50 + 'a') * 1000,
+        '+358 ' * 10000,
+        '(0' * 25000,
+        '1-' * 25000,
+        '1' * 50000,
+        'a.' * 25000,
+        'a@' * 25000,
+        'Aaaatie' * 7000,
+        'https://' + 'a' * 50000,
+    ]
+    MAX_SECONDS = 1.0
+
+    def test_adversarial_inputs(self):
+        """Each pattern must scan adversarial input in roughly linear time."""
+        matcher = RegexMatcher(ConfigCache.instance().get_regex_patterns('default'))
+        for entity_type, compiled in matcher.compiled:
+            for text in self.ADVERSARIAL_INPUTS:
+                start = time.perf_counter()
+                for _ in compiled.finditer(text):
+                    pass
+                elapsed = time.perf_counter() - start
+                self.assertLess(
+                    elapsed, self.MAX_SECONDS,
+                    f'{entity_type} pattern took {elapsed:.2f}s on {text[:20]!r}...'
+                )
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -13,6 +13,7 @@ import unittest
 
 from common_test_data import test_email, bad_email, test_filenames, bad_filenames
 from common_regex_test_base import BaseRegexTest
+from text_anonymizer.regex_matcher import RegexMatcher
 
 
 class TestEmailRecognizer(unittest.TestCase):
@@ -40,6 +41,29 @@ class TestFilenameRecognizer(unittest.TestCase):
         self.assertTrue(test_base.test_recognizer(), 'Filename regex test failed.')
 
 
+class TestRegexMatcherPrefilter(unittest.TestCase):
+    """Test that the one-pass prefilter does not drop matches."""
+
+    PATTERNS = [
+        {'entity_type': 'A', 'pattern': r'(x)y'},
+        {'entity_type': 'B', 'pattern': r'\b(\w+) \1\b'},
+    ]
+
+    def test_backreference_pattern(self):
+        """Backreferences must still match when joined with other patterns."""
+        matcher = RegexMatcher(self.PATTERNS)
+        entities = matcher.find('hello hello')
+        self.assertEqual([(e['label'], e['text']) for e in entities], [('B', 'hello hello')])
+
+    def test_backreference_pattern_allowed_types(self):
+        """Backreferences must still match in the union of an allowed type subset."""
+        matcher = RegexMatcher(self.PATTERNS)
+        for allowed_types in ({'B'}, {'A', 'B'}):
+            entities = matcher.find('hello hello', allowed_types=allowed_types)
+            self.assertEqual([(e['label'], e['text']) for e in entities], [('B', 'hello hello')])
+        self.assertEqual(matcher.find('hello hello', allowed_types={'A'}), [])
+
+
 if __name__ == '__main__':
     unittest.main()
 
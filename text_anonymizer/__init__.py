@@ -1,3 +1,3 @@
 from .anonymizer_interface import Anonymizer
-from .gliner_anonymizer import Anonymizer as TextAnonymizer
+from .gliner_anonymizer import Anonymizer as TextAnonymizer, get_anonymizer
 from .anonymizer_result import AnonymizerResult
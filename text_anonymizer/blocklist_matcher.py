@@ -0,0 +1,91 @@
+"""
+Case-insensitive whole-word matcher for profile blocklists.
+
+Each blocked word is compiled once as a \\b-delimited, case-insensitive regex.
+If the optional pyahocorasick package is installed, all words are also added to
+a single Aho-Corasick automaton so the text is scanned once regardless of the
+blocklist size. Word boundaries are checked with the same \\w definition as re,
+so both modes find the same matches.
+"""
+import re
+from typing import List, Dict, Set
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+WORD_CHAR = re.compile(r'\w')
+
+
+class BlocklistMatcher:
+    """Find blocklisted words in texts."""
+
+    def __init__(self, blocklist: Set[str], label: str = 'MUU_TUNNISTE'):
+        """
+        Compile blocklist.
+
+        Args:
+            blocklist: Words to find
+            label: Entity label given to matches
+        """
+        self.label = label
+        self.patterns = [
+            re.compile(r'\b' + re.escape(blocked_word) + r'\b', re.IGNORECASE)
+            for blocked_word in blocklist
+        ]
+        self.automaton = self._build_automaton(blocklist)
+
+    @staticmethod
+    def _build_automaton(blocklist: Set[str]):
+        """Build Aho-Corasick automaton of lowercased words, or None if not available."""
+        if ahocorasick is None or not blocklist:
+            return None
+        automaton = ahocorasick.Automaton()
+        for blocked_word in {word.lower() for word in blocklist}:
+            automaton.add_word(blocked_word, (blocked_word, len(blocked_word)))
+        automaton.make_automaton()
+        return automaton
+
+    def find(self, text: str) -> List[Dict]:
+        """
+        Find blocklisted words in text.
+
+        Returns:
+            List of entity dicts with score 1.0
+        """
+        lowered = text.lower()
+        # Lowercasing can change length for a few characters, offsets would not match
+        if self.automaton is not None and len(lowered) == len(text):
+            spans = self._find_spans_automaton(text, lowered)
+        else:
+            spans = [match.span() for pattern in self.patterns for match in pattern.finditer(text)]
+
+        return [{
+            'start': start,
+            'end': end,
+            'text': text[start:end],
+            'label': self.label,  # Generic identifier
+            'score': 1.0
+        } for start, end in spans]
+
+    def _find_spans_automaton(self, text: str, lowered: str) -> List[tuple]:
+        """Find word spans in one pass over the text, keeping only whole-word matches."""
+        spans = []
+        # Like re.finditer, matches of the same word do not overlap
+        last_end = {}
+        for end_index, (blocked_word, length) in self.automaton.iter(lowered):
+            start, end = end_index - length + 1, end_index + 1
+            if start < last_end.get(blocked_word, 0):
+                continue
+            if self._is_boundary(text, start) and self._is_boundary(text, end):
+                spans.append((start, end))
+                last_end[blocked_word] = end
+        return spans
+
+    @staticmethod
+    def _is_boundary(text: str, position: int) -> bool:
+        """Same as re's \\b at position."""
+        before = position > 0 and WORD_CHAR.match(text[position - 1]) is not None
+        after = position < len(text) and WORD_CHAR.match(text[position]) is not None
+        return before != after
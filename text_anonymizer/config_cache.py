@@ -3,11 +3,21 @@ Lightweight configuration loader for text file-based settings.
 Supports simple blocklist/grantlist and regex patterns via text files.
 """
 import os
-from typing import Optional, List, Dict, Set
+from types import MappingProxyType
+from typing import Optional, Dict, FrozenSet, Mapping, Tuple
 
 
 class ConfigCache:
-    """Simple configuration loader - not a singleton, just a utility."""
+    """
+    Simple configuration loader. Use instance() for a shared, process-wide loader.
+
+    Each file is read once per ConfigCache instance. Blocklists, grantlists and
+    GLiNER labels are read again when their file's modification time changes, so
+    edits take effect in a running process. The returned values are shared
+    between callers and therefore immutable.
+    """
+
+    _instance = None
 
     def __init__(self, config_dir: Optional[str] = None):
         """Initialize config loader with directory path."""
@@ -17,33 +27,62 @@ class ConfigCache:
             config_dir = os.path.join(project_root, 'config')
 
         self.config_dir = config_dir
+        self._label_mappings = None
+        self._regex_patterns = {}
+        # Per profile (file modification time, value), see _get_reloadable()
+        self._blocklists = {}
+        self._grantlists = {}
+        self._gliner_labels = {}
 
     @classmethod
     def instance(cls) -> 'ConfigCache':
-        """Get singleton instance (for backward compatibility)."""
-        return cls()
+        """Get shared instance, created on first call."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
     @classmethod
     def reset_instance(cls):
-        """Reset singleton instance (for backward compatibility with tests)."""
-        pass
+        """Reset shared instance so the next instance() call reloads configuration."""
+        cls._instance = None
 
-    def get_blocklist(self, profile: str) -> Set[str]:
+    @staticmethod
+    def _get_reloadable(cache: dict, profile: str, path: str, load):
+        """Return cached value of a profile file, loading it again if the file changed."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None  # Missing file
+        entry = cache.get(profile)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, load())
+            cache[profile] = entry
+        return entry[1]
+
+    def get_blocklist(self, profile: str) -> FrozenSet[str]:
         """Get blocklist for given profile."""
         blocklist_path = os.path.join(self.config_dir, profile, 'blocklist.txt')
-        return self._load_text_list(blocklist_path)
+        return self._get_reloadable(self._blocklists, profile, blocklist_path,
+                                    lambda: self._load_text_list(blocklist_path))
 
-    def get_grantlist(self, profile: str) -> Set[str]:
+    def get_grantlist(self, profile: str) -> FrozenSet[str]:
         """Get grantlist (allowlist) for given profile."""
         grantlist_path = os.path.join(self.config_dir, profile, 'grantlist.txt')
-        return self._load_text_list(grantlist_path)
+        return self._get_reloadable(self._grantlists, profile, grantlist_path,
+                                    lambda: self._load_text_list(grantlist_path))
 
-    def get_regex_patterns(self, profile: str) -> List[Dict[str, str]]:
+    def get_regex_patterns(self, profile: str) -> Tuple[Mapping[str, str], ...]:
         """
         Get regex patterns for given profile.
         Loads from regex_patterns.txt with format:
         ENTITY_NAME: regex_pattern
         """
+        if profile not in self._regex_patterns:
+            self._regex_patterns[profile] = self._load_regex_patterns(profile)
+        return self._regex_patterns[profile]
+
+    def _load_regex_patterns(self, profile: str) -> Tuple[Mapping[str, str], ...]:
+        """Read regex patterns file of a profile."""
         regex_path = os.path.join(self.config_dir, profile, 'regex_patterns.txt')
         patterns = []
 
@@ -54,16 +93,16 @@ class ConfigCache:
                         line = line.strip()
                         if line and not line.startswith('#') and ':' in line:
                             entity_type, pattern = line.split(':', 1)
-                            patterns.append({
+                            patterns.append(MappingProxyType({
                                 'entity_type': entity_type.strip(),
                                 'pattern': pattern.strip()
-                            })
+                            }))
             except Exception as e:
                 print(f"Warning: Failed to load regex patterns for profile '{profile}': {e}")
 
-        return patterns
+        return tuple(patterns)
 
-    def get_gliner_labels(self, profile: str) -> Optional[List[str]]:
+    def get_gliner_labels(self, profile: str) -> Optional[Tuple[str, ...]]:
         """
         Get GLiNER labels for a profile.
         Loads from gliner_labels.txt with one label per line.
@@ -72,9 +111,15 @@ class ConfigCache:
             profile: Profile name
 
         Returns:
-            List of GLiNER labels or None if file doesn't exist
+            Tuple of GLiNER labels or None if file doesn't exist
         """
         labels_file = os.path.join(self.config_dir, profile, 'gliner_labels.txt')
+        return self._get_reloadable(self._gliner_labels, profile, labels_file,
+                                    lambda: self._load_gliner_labels(profile))
+
+    def _load_gliner_labels(self, profile: str) -> Optional[Tuple[str, ...]]:
+        """Read GLiNER labels file of a profile."""
+        labels_file = os.path.join(self.config_dir, profile, 'gliner_labels.txt')
 
         if not os.path.exists(labels_file):
             return None
@@ -88,20 +133,26 @@ class ConfigCache:
                     if line and not line.startswith('#'):
                         labels.append(line)
 
-            return labels if labels else None
+            return tuple(labels) if labels else None
 
         except Exception as e:
             print(f"Warning: Failed to load GLiNER labels from {labels_file}: {e}")
             return None
 
-    def get_label_mappings(self) -> Dict[str, str]:
+    def get_label_mappings(self) -> Mapping[str, str]:
         """
         Get label mappings from config/label_mappings.txt.
         Format: INPUT_LABEL=OUTPUT_LABEL
 
         Returns:
-            Dictionary mapping input labels to output labels
+            Read-only mapping of input labels to output labels
         """
+        if self._label_mappings is None:
+            self._label_mappings = MappingProxyType(self._load_label_mappings())
+        return self._label_mappings
+
+    def _load_label_mappings(self) -> Dict[str, str]:
+        """Read label mappings file."""
         mappings_file = os.path.join(self.config_dir, 'label_mappings.txt')
         mappings = {}
 
@@ -123,7 +174,7 @@ class ConfigCache:
             print(f"Warning: Failed to load label mappings from {mappings_file}: {e}")
             return mappings
 
-    def _load_text_list(self, filepath: str) -> Set[str]:
+    def _load_text_list(self, filepath: str) -> FrozenSet[str]:
         """Load text list from file (one item per line)."""
         items = set()
         if os.path.exists(filepath):
@@ -135,4 +186,4 @@ class ConfigCache:
                             items.add(line)
             except Exception as e:
                 print(f"Warning: Failed to load list from {filepath}: {e}")
-        return items
+        return frozenset(items)
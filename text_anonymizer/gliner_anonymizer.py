@@ -1,9 +1,13 @@
 """
 Lightweight GLiNER-based text anonymizer with profile support.
 """
+import os
 import sys
 import re
 import time
+import functools
+import threading
+from collections import OrderedDict
 from typing import Optional, List, Dict, Set
 
 
@@ -17,6 +21,9 @@ except ImportError:
 from .anonymizer_interface import Anonymizer as AnonymizerInterface
 from .anonymizer_result import AnonymizerResult
 from .config_cache import ConfigCache
+from .regex_matcher import RegexMatcher, get_regex_matcher
+from .blocklist_matcher import BlocklistMatcher
+from .prediction_cache import PredictionCache
 
 
 
@@ -34,6 +41,35 @@ credit card brand, fax number, visa number, insurance company, identity document
 transaction number, national health insurance number, cvc, birth certificate number, 
 train ticket number, passport expiration date, and social_security_number.
 '''
+# Pattern to match: <LABEL> followed by one or more spaces and the same <LABEL>
+# Captures: (<LABEL>)(\s+)(<LABEL>)
+CONSECUTIVE_LABELS_PATTERN = re.compile(r'<([A-ZÄÖÅÉ_]+)>(\s+)<\1>')
+# Letter or digit. GLiNER entities are words, texts without any are not sent to the model.
+ALNUM_PATTERN = re.compile(r'[^\W_]')
+
+
+class _LRUCache:
+    """Small thread-safe least-recently-used cache."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
 
 class Anonymizer(AnonymizerInterface):
     DEFAULT_THRESHOLD = 0.5
@@ -50,6 +86,10 @@ class Anonymizer(AnonymizerInterface):
             debug_mode: bool = False,
             address_score_boost: float = 0.15,
             two_pass_detection: bool = True,
+            backend: Optional[str] = None,
+            use_gpu: Optional[bool] = None,
+            max_len: Optional[int] = None,
+            prediction_cache_dir: Optional[str] = None,
             **kwargs
     ):
         """
@@ -66,9 +106,35 @@ class Anonymizer(AnonymizerInterface):
                                avoid GLiNER label interference. Improves address accuracy
                                but adds ~40-50ms latency. Set to False for lower latency.
                                Default: True (prioritize accuracy)
+            backend: Inference backend, one of BACKENDS. Defaults to GLINER_BACKEND env
+                     variable or 'torch-fp32'. 'onnx-int8' expects model_name to contain
+                     an exported ONNX model (file name from GLINER_ONNX_FILE, default
+                     'model_quantized.onnx'), see GLiNER's convert_to_onnx.py --quantize.
+                     'torch-bf16' is applied on CUDA only, CPU stays in fp32.
+            use_gpu: Run torch backends on CUDA. Defaults to GLINER_USE_GPU env
+                     variable ('true'/'false'), otherwise CPU, except 'torch-bf16'
+                     which uses CUDA when available. Ignored for 'onnx-int8'.
+            max_len: GLiNER sequence window in words. Defaults to GLINER_MAX_LEN env
+                     variable or the model's own limit (384). A smaller window makes
+                     each forward pass cheaper, texts are chunked to fit it.
+            prediction_cache_dir: Directory for an on-disk cache of GLiNER predictions,
+                     see PredictionCache. Defaults to GLINER_PREDICTION_CACHE_DIR env
+                     variable, caching is off when neither is set.
         """
         super().__init__(model_name=model_name, debug_mode=debug_mode, **kwargs)
+        self.backend = backend or os.getenv('GLINER_BACKEND', 'torch-fp32')
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"Unknown GLiNER backend '{self.backend}', expected one of {self.BACKENDS}")
+        self.use_gpu = use_gpu
+        self.device = 'cpu'  # Set to 'cuda' by _load_or_download_model() when the model is moved
+        self.max_len = max_len or int(os.getenv('GLINER_MAX_LEN', '0')) or None
         self.model = self._load_or_download_model()
+        self.max_chars = self._apply_max_len()
+        prediction_cache_dir = prediction_cache_dir or os.getenv('GLINER_PREDICTION_CACHE_DIR')
+        self.prediction_cache = PredictionCache(
+            prediction_cache_dir,
+            namespace=f"{self.model_name}|{self.backend}|{self.max_len}"
+        ) if prediction_cache_dir else None
 
         # Score boost for addresses competing with person names
         # See docs/ADDRESS_DETECTION_FIX.md for rationale
@@ -94,27 +160,110 @@ class Anonymizer(AnonymizerInterface):
             "file_regex",
             "email_regex"
         ]
-        self.config_cache = ConfigCache()
+        self.config_cache = ConfigCache.instance()
 
         # Load label mappings from config file
         self.label_mappings = self.config_cache.get_label_mappings()
 
+        # Caches filled by prepare_labels() / on first use of a label set.
+        # Label embeddings are only available for bi-encoder GLiNER models.
+        self._separated_labels = {}
+        self._regex_matchers = {}
+        self._blocklist_matchers = {}
+        self._output_labels = {}  # Entity label -> mapped output label, see _map_entity_label()
+        self._replacement_tokens = {}  # Entity label -> '<OUTPUT_LABEL>', see _replacement_token()
+        self._label_embeddings = _LRUCache(self.LABEL_EMBEDDING_CACHE_SIZE)
+        # Recent anonymize()/anonymize_text() results, see _anonymize_core_cached()
+        self._results = _LRUCache(self.RESULT_CACHE_SIZE)
+        self._supports_label_embeddings = (
+            hasattr(self.model, 'encode_labels') and
+            hasattr(self.model, 'batch_predict_with_embeds') and
+            bool(getattr(getattr(self.model, 'config', None), 'labels_encoder', None))
+        )
+
+
+    BACKENDS = ('torch-fp32', 'torch-bf16', 'onnx-int8')
 
     def _load_or_download_model(self):
         """Load model from cache or download if not available"""
+        load_kwargs = self._backend_load_kwargs()
         try:
             if self.debug_mode:
                 print("Loading GLiNER model from cache...")
-            return GLiNER.from_pretrained(self.model_name, local_files_only=True)
+            model = GLiNER.from_pretrained(self.model_name, local_files_only=True, **load_kwargs)
         except Exception:
             if self.debug_mode:
                 print("Model not found in cache. Downloading GLiNER model...")
-            return GLiNER.from_pretrained(self.model_name)
+            model = GLiNER.from_pretrained(self.model_name, **load_kwargs)
+
+        if self.backend == 'onnx-int8':
+            return model
+
+        import torch
+        cuda = self.use_gpu
+        if cuda is None and os.getenv('GLINER_USE_GPU'):
+            cuda = os.getenv('GLINER_USE_GPU').lower() == 'true'
+        if cuda is None:
+            # CPU by default: CUDA must not be initialized in a gunicorn --preload
+            # master before workers fork
+            cuda = self.backend == 'torch-bf16' and torch.cuda.is_available()
+        if cuda and not torch.cuda.is_available():
+            print("Warning: use_gpu requested but CUDA is not available, running on CPU")
+            cuda = False
+
+        if cuda:
+            model = model.to('cuda')
+            self.device = 'cuda'
+            if self.backend == 'torch-bf16':
+                model = model.to(torch.bfloat16)
+        elif self.backend == 'torch-bf16' and self.debug_mode:
+            print("CUDA not used, torch-bf16 backend falls back to fp32 on CPU")
+        return model
+
+    def _apply_max_len(self) -> int:
+        """Set the model's sequence window to max_len and return the matching chunk size in chars."""
+        if not self.max_len:
+            return self.GLINER_MAX_CHARS
+
+        config = getattr(self.model, 'config', None)
+        if config is None or not hasattr(config, 'max_len'):
+            print("Warning: GLiNER model has no max_len setting, max_len is ignored")
+            return self.GLINER_MAX_CHARS
+
+        # GLiNER's data processor reads max_len from the model config
+        config.max_len = self.max_len
+        return max(self.GLINER_OVERLAP_CHARS * 2, self.GLINER_MAX_CHARS * self.max_len // self.GLINER_MAX_LEN)
+
+    def _backend_load_kwargs(self) -> Dict:
+        """GLiNER.from_pretrained arguments for the selected backend."""
+        if self.backend != 'onnx-int8':
+            return {}
+        load_kwargs = {
+            'load_onnx_model': True,
+            'load_tokenizer': True,
+            'onnx_model_file': os.getenv('GLINER_ONNX_FILE', 'model_quantized.onnx'),
+        }
+        try:
+            import onnxruntime
+            session_options = onnxruntime.SessionOptions()
+            session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            session_options.intra_op_num_threads = os.cpu_count() or 1
+            load_kwargs['session_options'] = session_options
+        except ImportError:
+            print("onnxruntime is required for the onnx-int8 backend: pip install onnxruntime")
+            sys.exit(1)
+        return load_kwargs
 
     # GLiNER has a token limit of 384, we use conservative char limit
     # Average ~4 chars per token, so 350 tokens * 4 = 1400 chars with safety margin
-    GLINER_MAX_CHARS = 1200
+    GLINER_MAX_LEN = 384
+    GLINER_MAX_CHARS = 1200  # Chunk size for GLINER_MAX_LEN, scaled when max_len is set
     GLINER_OVERLAP_CHARS = 100  # Overlap to avoid splitting entities at boundaries
+    GLINER_BATCH_SIZE = 32  # Chunks per batched GLiNER forward pass
+    LABEL_EMBEDDING_CACHE_SIZE = 64  # Label sets kept in the label embedding cache
+    RESULT_CACHE_SIZE = 512  # Texts kept in the anonymization result cache
+    RESULT_CACHE_MAX_CHARS = 10000  # Longer texts are not cached
+    OUTPUT_LABEL_CACHE_SIZE = 1024  # Entity labels kept in the output label and token memos
 
     def _split_text_into_chunks(self, text: str) -> List[tuple]:
         """
@@ -123,7 +272,7 @@ class Anonymizer(AnonymizerInterface):
         Uses sentence boundaries when possible to avoid splitting entities.
         Returns list of (chunk_text, start_offset) tuples.
         """
-        if len(text) <= self.GLINER_MAX_CHARS:
+        if len(text) <= self.max_chars:
             return [(text, 0)]
 
         chunks = []
@@ -131,7 +280,7 @@ class Anonymizer(AnonymizerInterface):
 
         while current_pos < len(text):
             # Calculate end position for this chunk
-            end_pos = min(current_pos + self.GLINER_MAX_CHARS, len(text))
+            end_pos = min(current_pos + self.max_chars, len(text))
 
             # If not at the end, try to find a good break point
             if end_pos < len(text):
@@ -200,21 +349,18 @@ class Anonymizer(AnonymizerInterface):
         # Split text into chunks if needed
         chunks = self._split_text_into_chunks(text)
 
-        # Check if we need two-pass detection (address + other labels)
-        has_address = 'address' in [l.lower() for l in labels]
-        other_labels = [l for l in labels if l.lower() != 'address']
-
         # Two-pass detection to avoid GLiNER label interference
         # GLiNER uses positional encoding, so label order affects scores.
         # Address detection is more reliable when run separately.
         # See: https://github.com/urchade/GLiNER/issues/192
         # Can be disabled via two_pass_detection=False for lower latency
-        if self.two_pass_detection and has_address and other_labels:
+        if self._uses_two_pass(labels):
+            other_labels = [l for l in labels if l.lower() != 'address']
             if self.debug_mode:
                 print(f"[GLINER] Using two-pass detection: address + {other_labels}")
 
             # Pass 1: Address detection with slightly lower threshold
-            address_threshold = max(0.3, threshold - 0.1)  # Lower threshold for addresses
+            address_threshold = self._address_threshold(threshold)
             address_entities = self._gliner_predict_chunks(text, chunks, ['address'], address_threshold)
 
             # Pass 2: Other entities with normal threshold
@@ -232,6 +378,89 @@ class Anonymizer(AnonymizerInterface):
         # Single-pass detection (either only address or no address label)
         return self._gliner_predict_chunks(text, chunks, labels, threshold)
 
+    def _uses_two_pass(self, labels: List[str]) -> bool:
+        """Whether addresses are detected in a separate GLiNER pass, see _find_entities_with_gliner()."""
+        lowered = [l.lower() for l in labels]
+        return self.two_pass_detection and 'address' in lowered and any(l != 'address' for l in lowered)
+
+    @staticmethod
+    def _address_threshold(threshold: float) -> float:
+        """Threshold of the separate address pass, slightly lower than for other labels."""
+        return max(0.3, threshold - 0.1)
+
+    def _filter_entities_by_threshold(self, entities: List[Dict], labels: List[str],
+                                      threshold: float) -> List[Dict]:
+        """
+        Keep GLiNER entities that would have been predicted with a higher threshold.
+
+        GLiNER decodes non-overlapping spans greedily from the highest score down,
+        so predictions at a higher threshold are the spans of a lower-threshold
+        prediction that score above it. This lets one model run serve several
+        thresholds. Spans predicted in overlapping chunks keep their highest score
+        (see _gliner_predict_batch()), so this also holds for chunked texts.
+
+        Args:
+            entities: Entities predicted with a threshold not above `threshold`
+            labels: GLiNER labels the entities were predicted with
+            threshold: Confidence threshold to apply
+
+        Returns:
+            New list of entities above the threshold (of their detection pass)
+        """
+        address_threshold = self._address_threshold(threshold) if self._uses_two_pass(labels) else threshold
+        return [
+            entity for entity in entities
+            if entity.get('score', 0.5) > (address_threshold if entity['label'].lower() == 'address' else threshold)
+        ]
+
+    def _get_label_embeddings(self, labels: List[str]):
+        """
+        Return cached label embeddings for a bi-encoder model, or None.
+
+        Bi-encoder GLiNER models encode labels independently of the text, so the
+        label side only needs to be computed once per label set. The cache keeps
+        the LABEL_EMBEDDING_CACHE_SIZE most recently used label sets, since API
+        callers can send arbitrary label lists.
+        """
+        if not self._supports_label_embeddings:
+            return None
+        key = tuple(labels)
+        embeddings = self._label_embeddings.get(key)
+        if embeddings is None:
+            embeddings = self.model.encode_labels(list(labels))
+            self._label_embeddings.put(key, embeddings)
+        return embeddings
+
+    def _predict(self, text: str, labels: List[str], threshold: float) -> List[Dict]:
+        """Run GLiNER on a single text, using cached label embeddings when available."""
+        if self._supports_label_embeddings or self.prediction_cache is not None:
+            return self._predict_batch([text], labels, threshold)[0]
+        return self.model.predict_entities(text, labels, threshold=threshold)
+
+    def _predict_batch(self, texts: List[str], labels: List[str], threshold: float) -> List[List[Dict]]:
+        """Run GLiNER on several texts, reading and filling the prediction cache if enabled."""
+        if self.prediction_cache is None:
+            return self._run_model_batch(texts, labels, threshold)
+
+        keys = [self.prediction_cache.key(text, labels, threshold) for text in texts]
+        predictions = [self.prediction_cache.get(key) for key in keys]
+        misses = [i for i, entities in enumerate(predictions) if entities is None]
+        if misses:
+            miss_predictions = self._run_model_batch([texts[i] for i in misses], labels, threshold)
+            for i, entities in zip(misses, miss_predictions):
+                self.prediction_cache.put(keys[i], entities)
+                predictions[i] = entities
+        if self.debug_mode:
+            print(f"[CACHE] {len(texts) - len(misses)}/{len(texts)} GLiNER predictions from disk")
+        return predictions
+
+    def _run_model_batch(self, texts: List[str], labels: List[str], threshold: float) -> List[List[Dict]]:
+        """Run GLiNER on several texts, using cached label embeddings when available."""
+        embeddings = self._get_label_embeddings(labels)
+        if embeddings is not None:
+            return self.model.batch_predict_with_embeds(texts, embeddings, labels, threshold=threshold)
+        return self.model.batch_predict_entities(texts, labels, threshold=threshold)
+
     def _gliner_predict_chunks(self, text: str, chunks: List[tuple],
                                 labels: List[str], threshold: float) -> List[Dict]:
         """
@@ -248,100 +477,167 @@ class Anonymizer(AnonymizerInterface):
         """
         if len(chunks) == 1:
             # No chunking needed, process directly
-            return self.model.predict_entities(text, labels, threshold=threshold)
+            return self._predict(text, labels, threshold)
 
-        # Process each chunk and collect entities with adjusted positions
-        all_entities = []
-        seen_spans = set()  # Track (start, end, label) to deduplicate overlaps
+        # All chunks go through batched model calls, entities are mapped back to
+        # original text coordinates and deduplicated across chunk overlaps
+        all_entities = self._gliner_predict_batch(
+            [text], [chunk_text for chunk_text, _ in chunks], [(0, offset) for _, offset in chunks],
+            labels, threshold
+        )[0]
 
-        for chunk_text, offset in chunks:
-            chunk_entities = self.model.predict_entities(chunk_text, labels, threshold=threshold)
+        if self.debug_mode:
+            print(f"[CHUNKING] Found {len(all_entities)} entities across {len(chunks)} chunks")
+
+        return all_entities
+
+    def _find_entities_with_gliner_batch(self, texts: List[str], threshold: float = 0.3,
+                                         custom_labels: Optional[List[str]] = None,
+                                         batch_size: int = GLINER_BATCH_SIZE) -> List[List[Dict]]:
+        """
+        Use GLiNER to find entities in several texts with batched forward passes.
+
+        Batched counterpart of _find_entities_with_gliner(). Chunks of all texts are
+        submitted to the model together, so a batch of short texts costs one model
+        call per detection pass instead of one call per text.
 
+        Args:
+            texts: Texts to analyze
+            threshold: Confidence threshold (0.0-1.0)
+            custom_labels: Custom labels to use instead of default
+            batch_size: Maximum number of chunks per model call
+
+        Returns:
+            List of entity lists, one per input text
+        """
+        labels = custom_labels if custom_labels is not None else self.labels
+
+        # Flatten chunks of all texts, remembering which text each chunk belongs to
+        chunk_texts = []
+        chunk_refs = []  # (text_index, offset) for each chunk
+        for index, text in enumerate(texts):
+            for chunk_text, offset in self._split_text_into_chunks(text):
+                chunk_texts.append(chunk_text)
+                chunk_refs.append((index, offset))
+
+        # Same two-pass logic as _find_entities_with_gliner()
+        if self._uses_two_pass(labels):
+            other_labels = [l for l in labels if l.lower() != 'address']
+            address_threshold = self._address_threshold(threshold)
+            address_entities = self._gliner_predict_batch(texts, chunk_texts, chunk_refs,
+                                                          ['address'], address_threshold, batch_size)
+            other_entities = self._gliner_predict_batch(texts, chunk_texts, chunk_refs,
+                                                        other_labels, threshold, batch_size)
+            return [a + o for a, o in zip(address_entities, other_entities)]
+
+        return self._gliner_predict_batch(texts, chunk_texts, chunk_refs, labels, threshold, batch_size)
+
+    def _gliner_predict_batch(self, texts: List[str], chunk_texts: List[str],
+                              chunk_refs: List[tuple], labels: List[str],
+                              threshold: float, batch_size: int = GLINER_BATCH_SIZE) -> List[List[Dict]]:
+        """
+        Run batched GLiNER prediction over chunks of several texts.
+
+        Args:
+            texts: Original full texts
+            chunk_texts: Chunk texts of all texts, in order
+            chunk_refs: (text_index, offset) tuple for each chunk
+            labels: Labels to detect
+            threshold: Confidence threshold
+            batch_size: Maximum number of chunks per model call
+
+        Returns:
+            List of entity lists with adjusted positions, one per input text
+        """
+        results = [[] for _ in texts]
+        if not chunk_texts:
+            return results
+
+        # Batch chunks of similar length together to minimize padding, then
+        # restore the original order
+        order = sorted(range(len(chunk_texts)), key=lambda i: len(chunk_texts[i]))
+        predictions = [None] * len(chunk_texts)
+        for i in range(0, len(order), batch_size):
+            bucket = order[i:i + batch_size]
+            bucket_predictions = self._predict_batch([chunk_texts[j] for j in bucket], labels, threshold)
+            for j, chunk_entities in zip(bucket, bucket_predictions):
+                predictions[j] = chunk_entities
+
+        # Deduplicate overlaps per text, keeping the highest-scoring copy of a span.
+        # The kept copy then does not depend on the threshold, which
+        # _filter_entities_by_threshold() relies on.
+        seen_spans = [{} for _ in texts]  # span key -> position in results
+        for (index, offset), chunk_entities in zip(chunk_refs, predictions):
             for entity in chunk_entities:
-                # Adjust positions to original text coordinates
                 adjusted_start = entity['start'] + offset
                 adjusted_end = entity['end'] + offset
-
-                # Create a unique key for deduplication
                 span_key = (adjusted_start, adjusted_end, entity['label'])
-
-                if span_key not in seen_spans:
-                    seen_spans.add(span_key)
-                    all_entities.append({
-                        'start': adjusted_start,
-                        'end': adjusted_end,
-                        'text': entity.get('text', text[adjusted_start:adjusted_end]),
-                        'label': entity['label'],
-                        'score': entity.get('score', 0.5)
-                    })
+                adjusted = {
+                    'start': adjusted_start,
+                    'end': adjusted_end,
+                    'text': entity.get('text', texts[index][adjusted_start:adjusted_end]),
+                    'label': entity['label'],
+                    'score': entity.get('score', 0.5)
+                }
+
+                position = seen_spans[index].get(span_key)
+                if position is None:
+                    seen_spans[index][span_key] = len(results[index])
+                    results[index].append(adjusted)
+                elif adjusted['score'] > results[index][position]['score']:
+                    results[index][position] = adjusted
 
         if self.debug_mode:
-            print(f"[CHUNKING] Found {len(all_entities)} entities across {len(chunks)} chunks")
+            print(f"[BATCH] Predicted {len(chunk_texts)} chunks from {len(texts)} texts (batch size {batch_size})")
 
-        return all_entities
+        return results
 
-    def _find_entities_with_regex(self, text: str, patterns: List[Dict[str, str]],
+    def _find_entities_with_regex(self, text: str, profile: str,
                                   allowed_types: Optional[Set[str]] = None) -> List[Dict]:
         """
         Find entities using regex patterns from profile.
 
+        Patterns are compiled once per profile (see RegexMatcher).
+
         Args:
             text: Text to search
-            patterns: List of pattern definitions
+            profile: Profile whose regex patterns are used
             allowed_types: Set of allowed entity types (if None, all are allowed)
         """
-        entities = []
-        for pattern_def in patterns:
-            entity_type = pattern_def['entity_type']
-
-            # Skip if this entity type is not in the allowed list
-            if allowed_types is not None and entity_type not in allowed_types:
-                continue
-
-            pattern = pattern_def['pattern']
-
-            try:
-                for match in re.finditer(pattern, text):
-                    entities.append({
-                        'start': match.start(),
-                        'end': match.end(),
-                        'text': match.group(),
-                        'label': entity_type,
-                        'score': 1.0  # Regex matches have perfect score
-                    })
-            except re.error as e:
-                if self.debug_mode:
-                    print(f"Warning: Invalid regex pattern '{pattern}': {e}")
-
-        return entities
-
-    def _find_blocklist_entities(self, text: str, blocklist: Set[str]) -> List[Dict]:
-        """Find entities from blocklist in text."""
-        entities = []
-        for blocked_word in blocklist:
-            # Case-insensitive search for blocked words
-            pattern = r'\b' + re.escape(blocked_word) + r'\b'
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append({
-                    'start': match.start(),
-                    'end': match.end(),
-                    'text': match.group(),
-                    'label': 'MUU_TUNNISTE',  # Generic identifier
-                    'score': 1.0
-                })
-
-        return entities
+        return self._get_regex_matcher(profile).find(text, allowed_types)
+
+    def _get_regex_matcher(self, profile: str) -> RegexMatcher:
+        """Return compiled matcher for a profile's regex patterns, shared with other instances."""
+        matcher = self._regex_matchers.get(profile)
+        if matcher is None:
+            matcher = get_regex_matcher(self.config_cache.get_regex_patterns(profile), debug_mode=self.debug_mode)
+            self._regex_matchers[profile] = matcher
+        return matcher
+
+    def _find_blocklist_entities(self, text: str, profile: str) -> List[Dict]:
+        """Find entities from profile blocklist in text (case-insensitive, whole words)."""
+        return self._get_blocklist_matcher(profile).find(text)
+
+    def _get_blocklist_matcher(self, profile: str) -> BlocklistMatcher:
+        """Return compiled matcher for a profile's blocklist, compiling it again when the list changes."""
+        blocklist = self.config_cache.get_blocklist(profile)
+        blocklist_and_matcher = self._blocklist_matchers.get(profile)
+        if blocklist_and_matcher is None or blocklist_and_matcher[0] is not blocklist:
+            blocklist_and_matcher = (blocklist, BlocklistMatcher(blocklist))
+            self._blocklist_matchers[profile] = blocklist_and_matcher
+        return blocklist_and_matcher[1]
 
     def _filter_grantlist(self, entities: List[Dict], grantlist: Set[str]) -> List[Dict]:
         """Remove entities that are in the grantlist (protected words)."""
         if not grantlist:
             return entities
 
+        protected = {word.lower() for word in grantlist}
         filtered = []
         for entity in entities:
             # Check if entity text is in grantlist (case-insensitive)
             entity_text = entity.get('text', '')
-            if entity_text.lower() not in {word.lower() for word in grantlist}:
+            if entity_text.lower() not in protected:
                 filtered.append(entity)
             elif self.debug_mode:
                 print(f"Protecting grantlisted entity: {entity_text}")
@@ -416,18 +712,12 @@ class Anonymizer(AnonymizerInterface):
         Returns:
             Text with consecutive identical labels merged
         """
-        import re
-
-        # Pattern to match: <LABEL> followed by one or more spaces and the same <LABEL>
-        # Captures: (<LABEL>)(\s+)(<LABEL>)
-        # We need to repeat this until no more matches (handle sequences of 3+ labels)
-        pattern = r'<([A-ZÄÖÅÉ_]+)>(\s+)<\1>'
-
         # Keep replacing until no more consecutive duplicates found
+        # (handles sequences of 3+ labels)
         previous = None
         while previous != text:
             previous = text
-            text = re.sub(pattern, r'<\1>', text)
+            text = CONSECUTIVE_LABELS_PATTERN.sub(r'<\1>', text)
 
         return text
 
@@ -446,11 +736,28 @@ class Anonymizer(AnonymizerInterface):
         Returns:
             Mapped output label (e.g., 'NIMI', 'PUHELINNUMERO', 'HETU')
         """
+        output_label = self._output_labels.get(label)
+        if output_label is not None:
+            return output_label
+
         # Convert label to uppercase with underscores (normalize)
         normalized_label = label.upper().replace(' ', '_')
 
         # Look up in mappings, fallback to normalized label if not found
-        return self.label_mappings.get(normalized_label, normalized_label)
+        output_label = sys.intern(self.label_mappings.get(normalized_label, normalized_label))
+        # API callers can send arbitrary labels, keep the memo bounded
+        if len(self._output_labels) < self.OUTPUT_LABEL_CACHE_SIZE:
+            self._output_labels[label] = output_label
+        return output_label
+
+    def _replacement_token(self, label: str) -> str:
+        """Return the text that replaces an entity, e.g. 'person' -> '<NIMI>'."""
+        token = self._replacement_tokens.get(label)
+        if token is None:
+            token = f"<{self._map_entity_label(label)}>"
+            if len(self._replacement_tokens) < self.OUTPUT_LABEL_CACHE_SIZE:
+                self._replacement_tokens[label] = token
+        return token
 
     def _separate_labels(self, labels: List[str]) -> tuple[List[str], Optional[Set[str]]]:
         """
@@ -487,73 +794,90 @@ class Anonymizer(AnonymizerInterface):
         # Return None for regex_types if empty (means don't use regex patterns)
         return gliner_labels, set(regex_types) if regex_types else None
 
-    def _anonymize_core(self, text: str, profile: str = 'default',
-                        labels: Optional[List[str]] = None,
-                        gliner_threshold: float = 0.3) -> tuple[str, List[Dict]]:
+    def _resolve_labels(self, profile: str,
+                        labels: Optional[List[str]]) -> tuple[List[str], Optional[Set[str]]]:
         """
-        Core anonymization logic returning both anonymized text and detected entities.
-
-        This is an internal method that performs the actual anonymization work.
-        Use anonymize() or anonymize_text() for public API.
+        Resolve active labels for a request and split them into GLiNER labels and regex types.
 
         Args:
-            text: Text to anonymize
-            profile: Profile name for configuration (defaults to 'default')
-            labels: List of entity labels to detect with suffixes
-            gliner_threshold: GLiNER confidence threshold (0.0-1.0)
+            profile: Effective profile name
+            labels: Labels given by the caller (may be None)
 
         Returns:
-            Tuple of (anonymized_text, entities_list)
+            Tuple of (gliner_labels, regex_entity_types_set or None)
         """
-        total_start = time.perf_counter() if self.debug_mode else None
-
-        if not text:
-            return text, []
-
-        # Use 'default' profile if none specified to ensure regex patterns are applied
-        effective_profile = profile if profile else 'default'
-
         # Load profile configuration
-        profile_labels = self.config_cache.get_gliner_labels(effective_profile)
+        profile_labels = self.config_cache.get_gliner_labels(profile)
 
         # Determine which labels to use (priority: parameter > profile > default)
         active_labels = labels or profile_labels or self.labels
 
-        # Check if blocklist is requested
-        enable_blocklist = 'blocklist' in active_labels if isinstance(active_labels, list) else False
-        if enable_blocklist:
-            active_labels = [l for l in active_labels if l != 'blocklist']
+        # Separate NER labels from regex entity types ('blocklist' is not a detection label)
+        return self._separate_labels_cached(tuple(l for l in active_labels if l != 'blocklist'))
 
-        # Separate NER labels from regex entity types
-        gliner_labels, regex_entity_types = self._separate_labels(active_labels)
+    def _separate_labels_cached(self, labels: tuple) -> tuple[List[str], Optional[Set[str]]]:
+        """Cached _separate_labels() keyed on the label tuple. Results must not be mutated."""
+        if labels not in self._separated_labels:
+            self._separated_labels[labels] = self._separate_labels(list(labels))
+        return self._separated_labels[labels]
 
-        # Collect entities from GLiNER (only if there are GLiNER labels)
-        entities = []
+    def prepare_labels(self, labels: Optional[List[str]]) -> Optional[tuple]:
+        """
+        Resolve a label list once before processing many texts with it.
+
+        Caches the NER/regex label split and, for bi-encoder GLiNER models,
+        precomputes label embeddings so labels are not re-encoded for every text.
+
+        Args:
+            labels: List of entity labels with suffixes (or None for defaults)
+
+        Returns:
+            Hashable label tuple to pass as `labels` to the anonymize methods,
+            or None if no labels were given
+        """
+        if not labels:
+            return None
+        key = tuple(labels)
+        gliner_labels, _ = self._separate_labels_cached(tuple(l for l in key if l != 'blocklist'))
         if gliner_labels:
-            t0 = time.perf_counter() if self.debug_mode else None
-            entities = self._find_entities_with_gliner(text, threshold=gliner_threshold,
-                                                       custom_labels=gliner_labels)
-            if self.debug_mode:
-                elapsed = time.perf_counter() - t0
-                print(f"[TIMING] GLiNER prediction: {elapsed:.3f}s")
-                if elapsed > 0.5:
-                    print(f"[TIMING] WARNING: GLiNER prediction slow (>{0.5}s)")
+            if self._uses_two_pass(gliner_labels):
+                self._get_label_embeddings(['address'])
+                self._get_label_embeddings([l for l in gliner_labels if l.lower() != 'address'])
+            else:
+                self._get_label_embeddings(gliner_labels)
+        return key
+
+    def _apply_entities(self, text: str, entities: List[Dict], profile: Optional[str],
+                        effective_profile: str,
+                        regex_entity_types: Optional[Set[str]]) -> tuple[str, List[Dict]]:
+        """
+        Add regex/blocklist matches to GLiNER entities, resolve them and mask the text.
+
+        Args:
+            text: Text to anonymize
+            entities: Entities found by GLiNER
+            profile: Profile requested by the caller (blocklist/grantlist only apply if set)
+            effective_profile: Profile used for regex patterns
+            regex_entity_types: Regex entity types to apply (None means all)
 
+        Returns:
+            Tuple of (anonymized_text, entities_list)
+        """
         # Always load regex patterns from effective_profile (defaults to 'default')
         # Always load blocklist/grantlist when an explicit profile is provided
-        regex_patterns = self.config_cache.get_regex_patterns(effective_profile)
+        regex_matcher = self._get_regex_matcher(effective_profile)
 
         if profile:
-            blocklist = self.config_cache.get_blocklist(profile)
+            has_blocklist = bool(self._get_blocklist_matcher(profile).patterns)
             grantlist = self.config_cache.get_grantlist(profile)
         else:
-            blocklist = set()
+            has_blocklist = False
             grantlist = set()
 
         # Add blocklist entities
-        if blocklist:
+        if has_blocklist:
             t0 = time.perf_counter() if self.debug_mode else None
-            blocklist_entities = self._find_blocklist_entities(text, blocklist)
+            blocklist_entities = self._find_blocklist_entities(text, profile)
             entities.extend(blocklist_entities)
             if self.debug_mode:
                 elapsed = time.perf_counter() - t0
@@ -562,14 +886,14 @@ class Anonymizer(AnonymizerInterface):
         # Add regex pattern entities from the profile
         # If the caller requested specific regex types (via labels), only apply those.
         # Otherwise (no specific regex labels requested) apply all profile regex patterns.
-        if regex_patterns:
+        if regex_matcher.compiled:
             t0 = time.perf_counter() if self.debug_mode else None
             if regex_entity_types is None:
                 # No specific regex types requested -> apply all patterns from profile
-                entities.extend(self._find_entities_with_regex(text, regex_patterns))
+                entities.extend(self._find_entities_with_regex(text, effective_profile))
             else:
                 # Apply only requested regex entity types
-                entities.extend(self._find_entities_with_regex(text, regex_patterns, allowed_types=regex_entity_types))
+                entities.extend(self._find_entities_with_regex(text, effective_profile, allowed_types=regex_entity_types))
             if self.debug_mode:
                 elapsed = time.perf_counter() - t0
                 print(f"[TIMING] Regex patterns: {elapsed:.3f}s")
@@ -582,18 +906,19 @@ class Anonymizer(AnonymizerInterface):
         entities = self._remove_overlapping_entities(entities)
 
         if not entities:
-            if self.debug_mode:
-                total_elapsed = time.perf_counter() - total_start
-                print(f"[TIMING] Total _anonymize_core: {total_elapsed:.3f}s (no entities found)")
             return text, []
 
-        # Replace entities in reverse order to maintain positions
+        # Entities are sorted and non-overlapping, build the result in one pass
+        # instead of re-slicing the whole text for every entity
         t0 = time.perf_counter() if self.debug_mode else None
-        result = text
-        for entity in sorted(entities, key=lambda x: x['start'], reverse=True):
-            start, end = entity['start'], entity['end']
-            label = self._map_entity_label(entity['label'])
-            result = result[:start] + f"<{label}>" + result[end:]
+        parts = []
+        position = 0
+        for entity in entities:
+            parts.append(text[position:entity['start']])
+            parts.append(self._replacement_token(entity['label']))
+            position = entity['end']
+        parts.append(text[position:])
+        result = ''.join(parts)
 
         # Merge consecutive identical labels (e.g., "<OSOITE> <OSOITE>" -> "<OSOITE>")
         result = self._merge_consecutive_labels(result)
@@ -602,6 +927,51 @@ class Anonymizer(AnonymizerInterface):
             elapsed = time.perf_counter() - t0
             print(f"[TIMING] Entity replacement: {elapsed:.3f}s")
 
+        return result, entities
+
+    def _anonymize_core(self, text: str, profile: str = 'default',
+                        labels: Optional[List[str]] = None,
+                        gliner_threshold: float = 0.3) -> tuple[str, List[Dict]]:
+        """
+        Core anonymization logic returning both anonymized text and detected entities.
+
+        This is an internal method that performs the actual anonymization work.
+        Use anonymize() or anonymize_text() for public API.
+
+        Args:
+            text: Text to anonymize
+            profile: Profile name for configuration (defaults to 'default')
+            labels: List of entity labels to detect with suffixes
+            gliner_threshold: GLiNER confidence threshold (0.0-1.0)
+
+        Returns:
+            Tuple of (anonymized_text, entities_list)
+        """
+        total_start = time.perf_counter() if self.debug_mode else None
+
+        # Nothing to detect in empty or whitespace-only text
+        if not text or text.isspace():
+            return text, []
+
+        # Use 'default' profile if none specified to ensure regex patterns are applied
+        effective_profile = profile if profile else 'default'
+        gliner_labels, regex_entity_types = self._resolve_labels(effective_profile, labels)
+
+        # Collect entities from GLiNER (only if there are GLiNER labels and words in text)
+        entities = []
+        if gliner_labels and ALNUM_PATTERN.search(text):
+            t0 = time.perf_counter() if self.debug_mode else None
+            entities = self._find_entities_with_gliner(text, threshold=gliner_threshold,
+                                                       custom_labels=gliner_labels)
+            if self.debug_mode:
+                elapsed = time.perf_counter() - t0
+                print(f"[TIMING] GLiNER prediction: {elapsed:.3f}s")
+                if elapsed > 0.5:
+                    print(f"[TIMING] WARNING: GLiNER prediction slow (>{0.5}s)")
+
+        result, entities = self._apply_entities(text, entities, profile, effective_profile,
+                                                regex_entity_types)
+
         if self.debug_mode:
             total_elapsed = time.perf_counter() - total_start
             print(f"[TIMING] Total _anonymize_core: {total_elapsed:.3f}s ({len(entities)} entities)")
@@ -610,6 +980,111 @@ class Anonymizer(AnonymizerInterface):
 
         return result, entities
 
+    def _anonymize_core_cached(self, text: str, profile: str = 'default',
+                               labels: Optional[List[str]] = None,
+                               gliner_threshold: float = 0.3) -> tuple[str, List[Dict]]:
+        """
+        _anonymize_core() with a result cache keyed by text, profile, labels and threshold.
+
+        Anonymization is deterministic for a loaded model and configuration, so
+        repeated texts reuse the previous result. Texts longer than
+        RESULT_CACHE_MAX_CHARS are not cached to keep memory use bounded.
+        """
+        if not text or len(text) > self.RESULT_CACHE_MAX_CHARS:
+            return self._anonymize_core(text, profile, labels, gliner_threshold)
+
+        # Profile files are part of the key, so edited files don't return stale results
+        effective_profile = profile if profile else 'default'
+        key = (text, profile, tuple(labels) if labels is not None else None, gliner_threshold,
+               self.config_cache.get_gliner_labels(effective_profile),
+               self.config_cache.get_blocklist(effective_profile),
+               self.config_cache.get_grantlist(effective_profile))
+        cached = self._results.get(key)
+        if cached is None:
+            cached = self._anonymize_core(text, profile, labels, gliner_threshold)
+            self._results.put(key, cached)
+        return cached
+
+    def _anonymize_core_batch(self, texts: List[Optional[str]], profile: str = 'default',
+                              labels: Optional[List[str]] = None,
+                              gliner_threshold: float = 0.3,
+                              batch_size: int = GLINER_BATCH_SIZE) -> List[tuple[Optional[str], List[Dict]]]:
+        """
+        Batched version of _anonymize_core().
+
+        Non-empty texts share batched GLiNER calls per detection pass. Empty texts
+        (None or '') and whitespace-only texts are passed through unchanged so
+        callers can keep positions.
+
+        Args:
+            texts: Texts to anonymize
+            profile: Profile name for configuration (defaults to 'default')
+            labels: List of entity labels to detect with suffixes
+            gliner_threshold: GLiNER confidence threshold (0.0-1.0)
+            batch_size: Maximum number of chunks per model call
+
+        Returns:
+            List of (anonymized_text, entities_list) tuples in input order
+        """
+        return self._anonymize_core_thresholds(texts, profile, labels, [gliner_threshold], batch_size)[0]
+
+    def _anonymize_core_thresholds(self, texts: List[Optional[str]], profile: str,
+                                   labels: Optional[List[str]], thresholds: List[float],
+                                   batch_size: int = GLINER_BATCH_SIZE) -> List[List[tuple[Optional[str], List[Dict]]]]:
+        """
+        Anonymize texts with several GLiNER thresholds from a single batched model run.
+
+        GLiNER runs once with the lowest threshold, higher thresholds filter its
+        entities (see _filter_entities_by_threshold()).
+
+        Args:
+            texts: Texts to anonymize
+            profile: Profile name for configuration (defaults to 'default')
+            labels: List of entity labels to detect with suffixes
+            thresholds: GLiNER confidence thresholds (0.0-1.0)
+            batch_size: Maximum number of chunks per model call
+
+        Returns:
+            One list of (anonymized_text, entities_list) tuples per threshold,
+            texts in input order
+        """
+        all_results = [[(text, []) for text in texts] for _ in thresholds]
+        indices = [i for i, text in enumerate(texts) if text and not text.isspace()]
+        if not indices or not thresholds:
+            return all_results
+
+        effective_profile = profile if profile else 'default'
+        gliner_labels, regex_entity_types = self._resolve_labels(effective_profile, labels)
+        min_threshold = min(thresholds)
+
+        batch_texts = [texts[i] for i in indices]
+        batch_entities = [[] for _ in batch_texts]
+        # Only texts with words are sent to GLiNER
+        gliner_positions = [j for j, text in enumerate(batch_texts) if ALNUM_PATTERN.search(text)]
+        if gliner_labels and gliner_positions:
+            t0 = time.perf_counter() if self.debug_mode else None
+            gliner_entities = self._find_entities_with_gliner_batch(
+                [batch_texts[j] for j in gliner_positions], threshold=min_threshold,
+                custom_labels=gliner_labels, batch_size=batch_size
+            )
+            for j, entities in zip(gliner_positions, gliner_entities):
+                batch_entities[j] = entities
+            if self.debug_mode:
+                elapsed = time.perf_counter() - t0
+                print(f"[TIMING] GLiNER batch prediction ({len(gliner_positions)} texts): {elapsed:.3f}s")
+
+        for threshold, results in zip(thresholds, all_results):
+            for i, text, entities in zip(indices, batch_texts, batch_entities):
+                if threshold == min_threshold:
+                    # _apply_entities() extends the list, keep the model output intact
+                    entities = list(entities)
+                else:
+                    entities = self._filter_entities_by_threshold(entities, gliner_labels, threshold)
+                results[i] = self._apply_entities(text, entities, profile, effective_profile,
+                                                  regex_entity_types)
+
+        return all_results
+
     def anonymize_text(self, text: str, profile: str = 'default',
                       labels: Optional[List[str]] = None,
                       gliner_threshold: float = DEFAULT_THRESHOLD) -> str:
@@ -630,7 +1105,7 @@ class Anonymizer(AnonymizerInterface):
         Returns:
             Anonymized text with entities replaced by labels
         """
-        anonymized_text, _ = self._anonymize_core(text, profile, labels, gliner_threshold)
+        anonymized_text, _ = self._anonymize_core_cached(text, profile, labels, gliner_threshold)
         return anonymized_text
 
     def anonymize(self, text: str,
@@ -657,13 +1132,96 @@ class Anonymizer(AnonymizerInterface):
         if not text:
             return AnonymizerResult(anonymized_text=None, summary={}, details={})
 
-        anonymized_text, entities = self._anonymize_core(
+        anonymized_text, entities = self._anonymize_core_cached(
             text,
             profile=profile,
             labels=labels,
             gliner_threshold=gliner_threshold
         )
+        return self._build_result(text, anonymized_text, entities)
+
+    def anonymize_text_batch(self, texts: List[Optional[str]], profile: str = 'default',
+                             labels: Optional[List[str]] = None,
+                             gliner_threshold: float = DEFAULT_THRESHOLD,
+                             batch_size: int = GLINER_BATCH_SIZE) -> List[Optional[str]]:
+        """
+        Anonymize several texts with batched GLiNER inference.
+
+        Equivalent to calling anonymize_text() for each text, but GLiNER runs once
+        per batch instead of once per text. Empty entries (None or '') are returned
+        as-is so their position in the output is preserved.
+
+        Args:
+            texts: Texts to anonymize
+            profile: Profile name for configuration (defaults to 'default')
+            labels: List of entity labels to detect with suffixes (see anonymize_text())
+            gliner_threshold: GLiNER confidence threshold (0.0-1.0)
+            batch_size: Maximum number of text chunks per GLiNER forward pass
+
+        Returns:
+            List of anonymized texts in input order
+        """
+        return [anonymized_text for anonymized_text, _ in
+                self._anonymize_core_batch(texts, profile, labels, gliner_threshold, batch_size)]
+
+    def anonymize_text_thresholds(self, texts: List[Optional[str]], thresholds: List[float],
+                                  profile: str = 'default',
+                                  labels: Optional[List[str]] = None,
+                                  batch_size: int = GLINER_BATCH_SIZE) -> Dict[float, List[Optional[str]]]:
+        """
+        Anonymize several texts with each of several GLiNER thresholds.
 
+        Same output as calling anonymize_text_batch() once per threshold, but GLiNER
+        runs only once, with the lowest threshold. Meant for threshold sweeps.
+
+        Args:
+            texts: Texts to anonymize
+            thresholds: GLiNER confidence thresholds (0.0-1.0)
+            profile: Profile name for configuration (defaults to 'default')
+            labels: List of entity labels to detect with suffixes (see anonymize_text())
+            batch_size: Maximum number of text chunks per GLiNER forward pass
+
+        Returns:
+            Dict of threshold -> list of anonymized texts in input order
+        """
+        all_results = self._anonymize_core_thresholds(texts, profile, labels, list(thresholds), batch_size)
+        return {
+            threshold: [anonymized_text for anonymized_text, _ in results]
+            for threshold, results in zip(thresholds, all_results)
+        }
+
+    def anonymize_batch(self, texts: List[Optional[str]],
+                        labels: Optional[List[str]] = None,
+                        profile: str = 'default',
+                        gliner_threshold: float = DEFAULT_THRESHOLD,
+                        batch_size: int = GLINER_BATCH_SIZE) -> List[AnonymizerResult]:
+        """
+        Anonymize several texts with batched GLiNER inference and return detailed results.
+
+        Batched counterpart of anonymize(). Empty entries produce an empty
+        AnonymizerResult, same as anonymize() does.
+
+        Args:
+            texts: Texts to anonymize
+            labels: List of entity labels to detect with suffixes (see anonymize())
+            profile: Profile name for blocklist/grantlist/regex patterns
+            gliner_threshold: GLiNER confidence threshold (0.0-1.0)
+            batch_size: Maximum number of text chunks per GLiNER forward pass
+
+        Returns:
+            List of AnonymizerResult objects in input order
+        """
+        results = []
+        for text, (anonymized_text, entities) in zip(
+                texts, self._anonymize_core_batch(texts, profile, labels, gliner_threshold, batch_size)):
+            if not text:
+                results.append(AnonymizerResult(anonymized_text=None, summary={}, details={}))
+            else:
+                results.append(self._build_result(text, anonymized_text, entities))
+        return results
+
+    def _build_result(self, text: str, anonymized_text: str, entities: List[Dict]) -> AnonymizerResult:
+        """Build AnonymizerResult with summary counts and entity details."""
         summary = {}
         details = {}
 
@@ -716,3 +1274,26 @@ class Anonymizer(AnonymizerInterface):
                     combined[entity_type].extend(entities)
         return combined
 
+
+def get_anonymizer(debug_mode: bool = False, **kwargs) -> Anonymizer:
+    """
+    Return a shared Anonymizer instance, creating it on first use.
+
+    Loading the GLiNER model takes seconds and hundreds of MB of memory, so
+    entrypoints should use this instead of constructing Anonymizer directly.
+    One instance is kept per distinct set of arguments.
+
+    Args:
+        debug_mode: Enable debug output
+        **kwargs: Other Anonymizer constructor arguments (must be hashable)
+
+    Returns:
+        Cached Anonymizer instance
+    """
+    # Normalize arguments, get_anonymizer() and get_anonymizer(debug_mode=False) share an instance
+    return _get_anonymizer(bool(debug_mode), tuple(sorted(kwargs.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_anonymizer(debug_mode: bool, kwargs: tuple) -> Anonymizer:
+    return Anonymizer(debug_mode=debug_mode, **dict(kwargs))
@@ -0,0 +1,69 @@
+"""
+On-disk cache of GLiNER predictions.
+
+Entities predicted for a text are stored as JSON files keyed by a blake2b hash
+of the model settings, labels, threshold and text. Repeated runs over the same
+texts (e.g. debug scripts and evaluation fixtures) then skip the model.
+Regex, blocklist and grantlist handling is not cached, so config changes take
+effect immediately. Delete the cache directory after updating model weights
+that keep the same name.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Optional, List, Dict
+
+
+class PredictionCache:
+    """Store GLiNER entity predictions under a directory."""
+
+    def __init__(self, cache_dir: str, namespace: str = ''):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache files, created on first write
+            namespace: Model settings that change predictions (model name, backend, ...)
+        """
+        self.cache_dir = cache_dir
+        self.namespace = namespace
+
+    def key(self, text: str, labels: List[str], threshold: float) -> str:
+        """Return cache key of a prediction."""
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (self.namespace, '\x1f'.join(labels), repr(threshold), text):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x1e')
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return cached entities, or None if not cached."""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, entities: List[Dict]):
+        """Store entities. Write errors only print a warning, the cache is an optimization."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entities, f, ensure_ascii=False, default=_json_default)
+            # Atomic rename, concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Failed to write prediction cache {path}: {e}")
+
+
+def _json_default(value):
+    """Convert numpy scalars (e.g. float32 scores) to Python numbers."""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
@@ -0,0 +1,178 @@
+"""
+Compiled multi-pattern matcher for profile regex patterns.
+
+Patterns are compiled once with Python's re module. If the optional
+python-hyperscan package is installed, all patterns are also compiled into a
+single Hyperscan database that is used as a prefilter: one pass over the text
+tells which patterns can match, and only those are run with re. Without
+Hyperscan, the patterns of the requested entity types are joined into one
+alternation and texts where it finds nothing are skipped after a single pass.
+Patterns with backreferences or named groups are left out of the alternation,
+since joining renumbers their groups, and are always run.
+Match results are always produced by the individual patterns, so output is
+the same in every mode.
+
+Compiling the Hyperscan database is the slow part, so get_regex_matcher()
+shares one matcher per pattern list between all anonymizer instances.
+"""
+import re
+import threading
+from typing import Optional, List, Dict, Mapping, Sequence, Set
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Numbered backreferences and group conditionals point at group numbers that
+# shift when patterns are joined into one alternation
+_BACKREFERENCE = re.compile(r'\\[1-9]|\\g<|\(\?P=|\(\?\(')
+
+
+class RegexMatcher:
+    """Match a fixed list of regex pattern definitions against texts."""
+
+    def __init__(self, patterns: Sequence[Mapping[str, str]], debug_mode: bool = False):
+        """
+        Compile pattern definitions.
+
+        Args:
+            patterns: Sequence of {'entity_type': ..., 'pattern': ...} mappings
+            debug_mode: Print warnings about invalid patterns
+        """
+        self.debug_mode = debug_mode
+        self.compiled = []  # List of (entity_type, compiled_pattern)
+        for pattern_def in patterns:
+            pattern = pattern_def['pattern']
+            try:
+                self.compiled.append((pattern_def['entity_type'], re.compile(pattern)))
+            except re.error as e:
+                if self.debug_mode:
+                    print(f"Warning: Invalid regex pattern '{pattern}': {e}")
+
+        self.database = self._build_database()
+        # (alternation, standalone pattern ids) per allowed entity type set, built on first use
+        self._combined = {}
+
+    def _build_database(self):
+        """Build Hyperscan prefilter database, or None if Hyperscan is not available."""
+        if hyperscan is None or not self.compiled:
+            return None
+        flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | \
+            hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[compiled.pattern.encode('utf-8') for _, compiled in self.compiled],
+                ids=list(range(len(self.compiled))),
+                elements=len(self.compiled),
+                flags=[flags] * len(self.compiled)
+            )
+            return database
+        except Exception as e:
+            if self.debug_mode:
+                print(f"Warning: Hyperscan compilation failed, using re only: {e}")
+            return None
+
+    def _get_combined(self, allowed_types: Optional[Set[str]]):
+        """Return (alternation, standalone ids) for the allowed patterns; alternation is None if they can't be combined."""
+        key = frozenset(allowed_types) if allowed_types is not None else None
+        if key not in self._combined:
+            self._combined[key] = self._build_combined(key)
+        return self._combined[key]
+
+    @staticmethod
+    def _is_combinable(compiled) -> bool:
+        """Check that a pattern matches the same inside an alternation as alone."""
+        return not compiled.groupindex and _BACKREFERENCE.search(compiled.pattern) is None
+
+    def _build_combined(self, allowed_types: Optional[frozenset]):
+        """Join allowed patterns into one alternation, keeping uncombinable ones apart."""
+        patterns = []
+        standalone = set()
+        for pattern_id, (entity_type, compiled) in enumerate(self.compiled):
+            if allowed_types is not None and entity_type not in allowed_types:
+                continue
+            if self._is_combinable(compiled):
+                patterns.append(compiled.pattern)
+            else:
+                standalone.add(pattern_id)
+        if not patterns:
+            return None, standalone
+        try:
+            return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)), standalone
+        except re.error as e:
+            # E.g. inline global flags do not survive joining
+            if self.debug_mode:
+                print(f"Warning: Regex patterns could not be combined: {e}")
+            return None, standalone
+
+    def _candidate_ids(self, text: str, allowed_types: Optional[Set[str]] = None) -> Optional[Set[int]]:
+        """Return ids of patterns that may match text, or None to try all patterns."""
+        if self.database is None:
+            # Alternation finds a match if any combined pattern does
+            combined, standalone = self._get_combined(allowed_types)
+            if combined is not None and combined.search(text) is None:
+                return set(standalone)
+            return None
+        matched = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(pattern_id)
+
+        self.database.scan(text.encode('utf-8'), match_event_handler=on_match)
+        return matched
+
+    def find(self, text: str, allowed_types: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        Find entities matching the patterns.
+
+        Args:
+            text: Text to search
+            allowed_types: Set of allowed entity types (if None, all are allowed)
+
+        Returns:
+            List of entity dicts with score 1.0
+        """
+        candidates = self._candidate_ids(text, allowed_types)
+        entities = []
+        for pattern_id, (entity_type, compiled) in enumerate(self.compiled):
+            # Skip if this entity type is not in the allowed list
+            if allowed_types is not None and entity_type not in allowed_types:
+                continue
+            if candidates is not None and pattern_id not in candidates:
+                continue
+
+            for match in compiled.finditer(text):
+                entities.append({
+                    'start': match.start(),
+                    'end': match.end(),
+                    'text': match.group(),
+                    'label': entity_type,
+                    'score': 1.0  # Regex matches have perfect score
+                })
+        return entities
+
+
+_shared_matchers = {}
+_shared_matchers_lock = threading.Lock()
+
+
+def get_regex_matcher(patterns: Sequence[Mapping[str, str]], debug_mode: bool = False) -> RegexMatcher:
+    """
+    Return a process-wide shared RegexMatcher for pattern definitions.
+
+    Args:
+        patterns: Sequence of {'entity_type': ..., 'pattern': ...} mappings
+        debug_mode: Print warnings about invalid patterns
+
+    Returns:
+        Matcher compiled on the first call with the same patterns
+    """
+    key = (tuple((p['entity_type'], p['pattern']) for p in patterns), debug_mode)
+    with _shared_matchers_lock:
+        matcher = _shared_matchers.get(key)
+        if matcher is None:
+            matcher = RegexMatcher(patterns, debug_mode=debug_mode)
+            _shared_matchers[key] = matcher
+    return matcher